@@ -0,0 +1,152 @@
+"""
+On-disk cache of decoded, pre-scaled images
+
+    python3 build_assets.py      write every image the game uses to the cache
+    DARK_SKIES_ASSET_CACHE=dir   cache directory (default .asset_cache, 0 turns the cache off)
+
+Each image is stored as raw RGB/RGBA pixels at the size the game draws it, so loading
+it is an mmap instead of a PNG decode and a smoothscale. manifest.json maps
+(path, size, format) to the raw file and the source's SHA-256; an entry whose source
+has changed since the build is ignored until the next build.
+"""
+import hashlib
+import json
+import mmap
+import os
+import threading
+import pygame
+
+MANIFEST_NAME = "manifest.json"
+
+
+def file_hash(path):
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class AssetCache:
+    """
+    Raw pixel buffers plus a manifest in one directory
+    load() is safe to call from worker threads; the surfaces it returns wrap the mapped
+    file and still need convert()/convert_alpha() on the main thread.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._manifest = None
+        self._verified = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return bool(self.directory)
+
+    @staticmethod
+    def _key(path, size, alpha):
+        size = f"{int(size[0])}x{int(size[1])}" if size else "source"
+        return f"{path}|{size}|{'RGBA' if alpha else 'RGB'}"
+
+    def _entries(self):
+        if self._manifest is None:
+            try:
+                with open(os.path.join(self.directory, MANIFEST_NAME)) as f:
+                    self._manifest = json.load(f)
+            except (OSError, ValueError):
+                self._manifest = {}
+        return self._manifest
+
+    def _source_matches(self, path, entry):
+        """
+        True if the source file is the one the entry was built from
+        An unchanged size and mtime is trusted; otherwise the file is hashed once per run
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if stat.st_size == entry["source_bytes"] and stat.st_mtime_ns == entry["source_mtime_ns"]:
+            return True
+        source_hash = self._verified.get(path)
+        if source_hash is None:
+            source_hash = self._verified[path] = file_hash(path)
+        return source_hash == entry["source_hash"]
+
+    def load(self, path, size, alpha=True):
+        """Return the cached image at path and size (None for the source size), or None if it is missing or stale"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries().get(self._key(path, size, alpha))
+            valid = entry is not None and self._source_matches(path, entry)
+            if not valid:
+                self.misses += 1
+                return None
+        try:
+            with open(os.path.join(self.directory, entry["file"]), "rb") as f:
+                pixels = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            surface = pygame.image.frombuffer(pixels, tuple(entry["size"]), entry["format"])
+        except (OSError, ValueError, pygame.error) as e:
+            print(f"Asset cache: ignoring {entry['file']}: {e}")
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return surface
+
+    def store(self, path, size, alpha, surface):
+        """Write surface as the cached image of path at size (used by the build step)"""
+        source_hash = file_hash(path)
+        stat = os.stat(path)
+        image_format = "RGBA" if alpha else "RGB"
+        width, height = surface.get_size()
+        file_name = f"{source_hash[:16]}-{width}x{height}-{image_format}.raw"
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, file_name), "wb") as f:
+            f.write(pygame.image.tobytes(surface, image_format))
+        with self._lock:
+            self._entries()[self._key(path, size, alpha)] = {
+                "file": file_name,
+                "size": [width, height],
+                "format": image_format,
+                "source_hash": source_hash,
+                "source_bytes": stat.st_size,
+                "source_mtime_ns": stat.st_mtime_ns,
+            }
+            self._verified[path] = source_hash
+
+    def save(self, keep=None):
+        """
+        Write the manifest and delete raw files it no longer references
+        With keep, entries whose key is not in keep are dropped first
+        """
+        with self._lock:
+            entries = self._entries()
+            if keep is not None:
+                keep = {self._key(path, size, alpha) for path, size, alpha in keep}
+                for key in [key for key in entries if key not in keep]:
+                    del entries[key]
+            os.makedirs(self.directory, exist_ok=True)
+            manifest_path = os.path.join(self.directory, MANIFEST_NAME)
+            with open(manifest_path + ".tmp", "w") as f:
+                json.dump(entries, f, indent=2, sort_keys=True)
+            os.replace(manifest_path + ".tmp", manifest_path)
+            used = {entry["file"] for entry in entries.values()}
+        for name in os.listdir(self.directory):
+            if name.endswith(".raw") and name not in used:
+                os.remove(os.path.join(self.directory, name))
+
+
+def _directory_from_env():
+    directory = os.getenv("DARK_SKIES_ASSET_CACHE", ".asset_cache")
+    return None if directory in ("", "0") else directory
+
+
+# shared cache used by the asset registry
+asset_cache = AssetCache(_directory_from_env())
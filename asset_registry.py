@@ -0,0 +1,195 @@
+import threading
+import time
+import pygame
+from asset_cache import asset_cache
+from constants import png_size
+from profiler import profiler
+
+
+class AssetRegistry:
+    """
+    Loads, converts and scales each sprite at most once per target size
+    Surfaces are shared by every object that asks for the same (path, size)
+    Images can also be decoded ahead of time on worker threads with prefetch(); they
+    are converted for the display by install_prefetched() on the main thread. With a
+    cache, images built ahead of time by build_assets.py are mapped from disk instead
+    of being decoded and scaled.
+    """
+
+    def __init__(self, cache=None):
+        self.cache = cache
+        self._sources = {}
+        self._scaled = {}
+        self._stats = {}
+        self._source_sizes = {}
+        self._prefetched = {}
+        self._lock = threading.Lock()
+
+    def get(self, path, size=None, alpha=True):
+        """
+        Return the image at path, scaled to size (width, height) if given
+        The returned surface is shared, so callers must not draw onto it
+        """
+        key = (path, tuple(size) if size else None, alpha)
+        surface = self._scaled.get(key)
+        if surface is not None:
+            return surface
+
+        surface = self._from_cache(key)
+        if surface is not None:
+            self._scaled[key] = surface
+            return surface
+        source = self._load(path, alpha)
+        if size is None:
+            surface = source
+        else:
+            start = time.perf_counter()
+            surface = pygame.transform.smoothscale(source, (int(size[0]), int(size[1])))
+            profiler.count("surfaces")
+            self._record(key, "scale_ms", (time.perf_counter() - start) * 1000, surface)
+        self._scaled[key] = surface
+        return surface
+
+    def get_scaled_to_width(self, path, width, alpha=True):
+        """Return the image at path scaled to width, keeping its aspect ratio"""
+        size = self.size_for_width(path, width)
+        if size is None:
+            # Not a readable PNG: decode it to find its size (raises if it can't be loaded)
+            source_width, source_height = self._load(path, alpha).get_size()
+            size = int(width), int(source_height * (width / source_width))
+        return self.get(path, size, alpha)
+
+    def size_for_width(self, path, width):
+        """
+        Size of the image at path scaled to width, keeping its aspect ratio
+        Only the PNG header is read; None if the image hasn't been loaded and has no readable header
+        """
+        source_size = self._source_sizes.get(path) or png_size(path)
+        if source_size is None:
+            return None
+        height = source_size[1] * (width / source_size[0])
+        return int(width), int(height)
+
+    def prefetch(self, path, size=None, alpha=True, width=None):
+        """
+        Decode and scale an image without converting it; safe to call from a worker thread
+        width scales to that width keeping the aspect ratio, like get_scaled_to_width()
+        """
+        if width is not None:
+            size = self.size_for_width(path, width)
+            if size is None:
+                raise OSError(f"Can't read the size of {path}")
+        key = (path, tuple(size) if size else None, alpha)
+        start = time.perf_counter()
+        surface = self.cache.load(path, size, alpha) if self.cache else None
+        if surface is not None:
+            with self._lock:
+                self._prefetched[key] = (surface, (time.perf_counter() - start) * 1000, 0.0)
+            return
+        source = pygame.image.load(path)
+        load_ms = (time.perf_counter() - start) * 1000
+        surface = source
+        scale_ms = 0.0
+        if size is not None:
+            start = time.perf_counter()
+            surface = pygame.transform.smoothscale(source, (int(size[0]), int(size[1])))
+            scale_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self._source_sizes[path] = source.get_size()
+            self._prefetched[key] = (surface, load_ms, scale_ms)
+
+    def install_prefetched(self):
+        """Convert prefetched images for the display and add them to the cache (main thread only)"""
+        with self._lock:
+            pending, self._prefetched = self._prefetched, {}
+        for key, (surface, load_ms, scale_ms) in pending.items():
+            if key in self._scaled:
+                continue
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha() if key[2] else surface.convert()
+                profiler.count("surfaces")
+            self._scaled[key] = surface
+            self._record(key, "load_ms", load_ms, surface)
+            self._record(key, "scale_ms", scale_ms, surface)
+        return len(pending)
+
+    def build(self, path, size=None, alpha=True):
+        """Decode and scale an image the way prefetch() does and write it to the cache"""
+        source = pygame.image.load(path)
+        surface = source
+        if size is not None:
+            surface = pygame.transform.smoothscale(source, (int(size[0]), int(size[1])))
+        self.cache.store(path, size, alpha, surface)
+        return surface
+
+    def _from_cache(self, key):
+        """The cached image for key, converted for the display (None on a miss)"""
+        if not self.cache:
+            return None
+        path, size, alpha = key
+        start = time.perf_counter()
+        surface = self.cache.load(path, size, alpha)
+        if surface is None:
+            return None
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        profiler.count("surfaces")
+        self._record(key, "load_ms", (time.perf_counter() - start) * 1000, surface)
+        return surface
+
+    def _load(self, path, alpha):
+        key = (path, alpha)
+        source = self._sources.get(key)
+        if source is None:
+            start = time.perf_counter()
+            source = pygame.image.load(path)
+            profiler.count("surfaces")
+            # Conversion needs a display mode; headless callers keep the decoded surface
+            if pygame.display.get_surface() is not None:
+                source = source.convert_alpha() if alpha else source.convert()
+            self._sources[key] = source
+            self._source_sizes[path] = source.get_size()
+            self._record((path, None, alpha), "load_ms", (time.perf_counter() - start) * 1000, source)
+        return source
+
+    def _record(self, key, field, elapsed_ms, surface):
+        stats = self._stats.setdefault(key, {"load_ms": 0.0, "scale_ms": 0.0, "bytes": 0})
+        stats[field] += elapsed_ms
+        stats["bytes"] = surface.get_pitch() * surface.get_height()
+
+    def clear(self):
+        """Forget every cached surface (e.g. after the display mode changes)"""
+        self._sources.clear()
+        self._scaled.clear()
+        self._stats.clear()
+        self._source_sizes.clear()
+        with self._lock:
+            self._prefetched.clear()
+
+    def report(self):
+        """Return load/scale timings and memory for each cached asset"""
+        rows = []
+        for (path, size, alpha), stats in sorted(self._stats.items(), key=lambda item: str(item[0])):
+            rows.append({
+                "path": path,
+                "size": list(size) if size else None,
+                "alpha": alpha,
+                "load_ms": round(stats["load_ms"], 3),
+                "scale_ms": round(stats["scale_ms"], 3),
+                "bytes": stats["bytes"],
+            })
+        return rows
+
+    def print_report(self):
+        """Print a per-asset summary of load timings and memory"""
+        total_bytes = 0
+        for row in self.report():
+            size = "x".join(str(v) for v in row["size"]) if row["size"] else "source"
+            print(f"Asset {row['path']} [{size}]: load {row['load_ms']:.1f} ms, "
+                  f"scale {row['scale_ms']:.1f} ms, {row['bytes'] / 1024:.0f} KB")
+            total_bytes += row["bytes"]
+        print(f"Asset registry total: {total_bytes / 1024:.0f} KB")
+
+
+# shared registry used by the game
+registry = AssetRegistry(asset_cache)
@@ -0,0 +1,94 @@
+import pygame
+from asset_registry import registry
+from constants import (VAN_IMG_PATH, CRASHED_VAN_IMG_PATH, ASTEROID_IMG_PATH, ASTEROID_SMALL_IMG_PATH, ERROR_IMG_PATH,
+                       BUG_IMG_PATH, BIRD_WIDTH, BIRD_HEIGHT, ASTEROID_LARGE_SIZE, ASTEROID_SMALL_SIZE, ERROR_SIZE,
+                       BUG_SIZE)
+
+# (name, path, size) of every in-game sprite, at the size it is drawn
+GAME_SPRITES = (
+    ("van", VAN_IMG_PATH, (BIRD_WIDTH, BIRD_HEIGHT)),
+    ("van_crashed", CRASHED_VAN_IMG_PATH, (BIRD_WIDTH, BIRD_HEIGHT)),
+    ("asteroid_large", ASTEROID_IMG_PATH, (ASTEROID_LARGE_SIZE, ASTEROID_LARGE_SIZE)),
+    ("asteroid_small", ASTEROID_SMALL_IMG_PATH, (ASTEROID_SMALL_SIZE, ASTEROID_SMALL_SIZE)),
+    ("error", ERROR_IMG_PATH, (ERROR_SIZE, ERROR_SIZE)),
+    ("bug", BUG_IMG_PATH, (BUG_SIZE, BUG_SIZE)),
+)
+
+
+def _aligned(x):
+    """x rounded up to a whole number of 16-byte (4-pixel) blocks"""
+    return (x + 3) & ~3
+
+
+class SpriteAtlas:
+    """
+    Packs sprites into one display-format surface with a named sub-rect per sprite
+    Sprites are drawn with screen.blit(atlas.surface, position, atlas.area(name)), so every
+    in-game blit shares one source surface. The atlas is packed on first use, after
+    the display mode is set, from the sprites scaled by the asset registry. Sprite
+    columns and the row pitch are kept 16-byte aligned: SDL's SIMD blitters run
+    about half as fast from unaligned rows.
+    """
+
+    def __init__(self, sprites, max_width=512, padding=1):
+        self.sprites = sprites
+        self.max_width = max_width
+        self.padding = padding
+        self._surface = None
+        self._areas = {}
+        self._masks = {}
+
+    @property
+    def surface(self):
+        if self._surface is None:
+            self._build()
+        return self._surface
+
+    def area(self, name):
+        """The sub-rect of sprite name within the atlas surface"""
+        if self._surface is None:
+            self._build()
+        return self._areas[name]
+
+    def mask(self, name):
+        """Collision mask of sprite name, built on first use"""
+        mask = self._masks.get(name)
+        if mask is None:
+            mask = self._masks[name] = pygame.mask.from_surface(self.surface.subsurface(self.area(name)))
+        return mask
+
+    def invalidate(self):
+        """Repack on next use (e.g. after the display mode changes)"""
+        self._surface = None
+        self._areas.clear()
+        self._masks.clear()
+
+    def _build(self):
+        images = [(name, registry.get(path, size)) for name, path, size in self.sprites]
+        # Shelf packing, tallest first: rows fill left to right up to max_width
+        areas = {}
+        x = y = shelf_height = width = 0
+        for name, image in sorted(images, key=lambda item: -item[1].get_height()):
+            image_width, image_height = image.get_size()
+            if x and x + image_width > self.max_width:
+                x, y = 0, y + shelf_height + self.padding
+                shelf_height = 0
+            areas[name] = pygame.Rect(x, y, image_width, image_height)
+            width = max(width, x + image_width)
+            x = _aligned(x + image_width + self.padding)
+            shelf_height = max(shelf_height, image_height)
+
+        surface = pygame.Surface((_aligned(width), y + shelf_height), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        surface.fill((0, 0, 0, 0))
+        # Copy pixels and alpha exactly; blending onto the transparent atlas would darken edges
+        surface.blits([(image, areas[name], None, pygame.BLEND_RGBA_MAX) for name, image in images],
+                      doreturn=False)
+        self._surface = surface
+        self._areas = areas
+        self._masks.clear()
+
+
+# shared atlas of the van, obstacle and symbol sprites
+sprite_atlas = SpriteAtlas(GAME_SPRITES)
@@ -0,0 +1,122 @@
+import os
+import threading
+import pygame
+
+
+class AudioManager:
+    """
+    Decodes sound effects on first use (or on a worker thread) and streams music
+    Decoded effects stay cached on the manager, so restarts reuse them. Long tracks
+    go through pygame.mixer.music, which streams from disk instead of decoding the
+    whole file. While muted nothing is decoded or loaded at all.
+    """
+
+    def __init__(self, effect_paths, music_path=None, effect_volume=0.7, music_volume=0.5):
+        self.effect_paths = dict(effect_paths)
+        self.music_path = music_path
+        self.effect_volume = effect_volume
+        self.music_volume = music_volume
+        self.muted = False
+        self._sounds = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+        self._music_loaded = False
+        self._preload_thread = None
+
+    @staticmethod
+    def available():
+        """True if the mixer is initialized (there may be no audio device)"""
+        return pygame.mixer.get_init() is not None
+
+    def get(self, name):
+        """Return the decoded effect, decoding it on first use (None if missing)"""
+        if name in self._sounds:
+            return self._sounds[name]
+        with self._lock:
+            lock = self._locks.setdefault(name, threading.Lock())
+        with lock:
+            if name not in self._sounds:
+                self._sounds[name] = self._decode(name)
+        return self._sounds[name]
+
+    def _decode(self, name):
+        sound_path = self.effect_paths.get(name)
+        try:
+            if sound_path and os.path.exists(sound_path):
+                sound = pygame.mixer.Sound(sound_path)
+                sound.set_volume(self.effect_volume)
+                print(f"Loaded sound: {name}")
+                return sound
+            if sound_path:
+                print(f"Sound file not found: {sound_path}")
+            else:
+                print(f"Sound disabled: {name}")
+        except pygame.error as e:
+            print(f"Error loading sound {name}: {e}")
+        return None
+
+    def preload(self, background=True):
+        """Decode every effect ahead of use, on a worker thread by default; skipped when muted"""
+        if self.muted or not self.available():
+            return
+        if not background:
+            for name in self.effect_paths:
+                self.get(name)
+            return
+        if self._preload_thread is None or not self._preload_thread.is_alive():
+            pending = [name for name in self.effect_paths if name not in self._sounds]
+            if pending:
+                self._preload_thread = threading.Thread(
+                    target=lambda: [self.get(name) for name in pending], name="audio-preload", daemon=True)
+                self._preload_thread.start()
+
+    def play(self, name, volume=1.0):
+        """Play a sound effect if it exists and not muted"""
+        if self.muted or not self.available():
+            return
+        sound = self.get(name)
+        if sound:
+            sound.set_volume(volume)
+            sound.play()
+
+    def set_effect_volume(self, volume):
+        """Set volume for all sound effects (0.0 to 1.0)"""
+        self.effect_volume = volume
+        self._apply_effect_volume(volume)
+
+    def _apply_effect_volume(self, volume):
+        for sound in self._sounds.values():
+            if sound:
+                sound.set_volume(volume)
+
+    def start_music(self):
+        """Start streaming the looping background track (once; restarts keep it playing)"""
+        if self.muted or self._music_loaded or not self.music_path or not self.available():
+            return
+        try:
+            if os.path.exists(self.music_path):
+                pygame.mixer.music.load(self.music_path)
+                pygame.mixer.music.set_volume(self.music_volume)
+                pygame.mixer.music.play(-1)  # Loop indefinitely
+                self._music_loaded = True
+                print("Background music loaded and playing")
+            else:
+                print(f"Background music file not found: {self.music_path}")
+        except pygame.error as e:
+            print(f"Error loading background music: {e}")
+
+    def set_muted(self, muted):
+        """Mute or unmute everything; unmuting loads whatever was skipped while muted"""
+        self.muted = muted
+        if not self.available():
+            return
+        if muted:
+            self._apply_effect_volume(0.0)
+            if self._music_loaded:
+                pygame.mixer.music.set_volume(0.0)
+        else:
+            self._apply_effect_volume(self.effect_volume)
+            if self._music_loaded:
+                pygame.mixer.music.set_volume(self.music_volume)
+            else:
+                self.start_music()
@@ -0,0 +1,283 @@
+"""
+Benchmark harness for Dark Skies
+
+Runs a scripted, seeded session under the SDL dummy drivers and prints JSON with
+frame-time percentiles, per-function timings, allocations and cold-start time.
+
+    python benchmark.py --frames 1200 --seed 7 --output bench.json
+    python benchmark.py --compare bench.json
+"""
+import argparse
+import contextlib
+import importlib
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+
+class FunctionTimer:
+    """Wraps functions on a module or class and accumulates their call counts and time"""
+
+    def __init__(self):
+        self.stats = {}
+        self._patched = []
+
+    def wrap(self, owner, attr, name=None):
+        name = name or attr
+        original = getattr(owner, attr)
+        stats = self.stats.setdefault(name, {"calls": 0, "total_ms": 0.0})
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                stats["calls"] += 1
+                stats["total_ms"] += (time.perf_counter() - start) * 1000
+
+        setattr(owner, attr, timed)
+        self._patched.append((owner, attr, original))
+
+    def restore(self):
+        for owner, attr, original in reversed(self._patched):
+            setattr(owner, attr, original)
+        self._patched = []
+
+    def report(self):
+        result = {}
+        for name, stats in self.stats.items():
+            calls = stats["calls"]
+            result[name] = {
+                "calls": calls,
+                "total_ms": round(stats["total_ms"], 3),
+                "mean_ms": round(stats["total_ms"] / calls, 4) if calls else 0.0,
+            }
+        return result
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def frame_summary(frame_ms):
+    return {
+        "frames": len(frame_ms),
+        "mean_ms": round(sum(frame_ms) / len(frame_ms), 4) if frame_ms else 0.0,
+        "p50_ms": round(percentile(frame_ms, 50), 4),
+        "p95_ms": round(percentile(frame_ms, 95), 4),
+        "p99_ms": round(percentile(frame_ms, 99), 4),
+        "max_ms": round(max(frame_ms), 4) if frame_ms else 0.0,
+    }
+
+
+def setup_game(renderer_mode):
+    """Open the (dummy) window and load what the gameplay loop needs"""
+    import pygame
+    import main
+    from renderer import create_renderer
+
+    pygame.init()
+    screen = pygame.display.set_mode((main.SCREEN_WIDTH, main.SCREEN_HEIGHT))
+    # Same load path as main(): pre-scaled to the window, from the asset cache when it is built
+    main.background_img = main.registry.get(main.BKG_IMG_PATH, main.BACKGROUND_SIZE, alpha=False)
+    main.game_over = False
+    if renderer_mode:
+        main.renderer = create_renderer(renderer_mode)
+    return pygame, main, screen
+
+
+def run_session(main, screen, frames, seed):
+    """Drive a scripted autopilot session, returning per-frame times in ms"""
+    from simulation import GameState, autopilot
+
+    state = GameState(seed=seed, with_sprites=True)
+    frame_ms = []
+    restarts = 0
+    for _ in range(frames):
+        start = time.perf_counter()
+        if state.game_over:
+            # Same in-place restart as pressing R in the game
+            state.reset(seed=seed + restarts + 1)
+            restarts += 1
+        state.step(autopilot(state))
+        main.game_over = state.game_over
+        main.draw_window(screen, state.bird, state.pipes, state.score, state.hit_count)
+        frame_ms.append((time.perf_counter() - start) * 1000)
+    return frame_ms, restarts
+
+
+def measure_allocations(main, screen, frames, seed):
+    """Re-run a shorter session under tracemalloc and summarise Python allocations"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    run_session(main, screen, frames, seed)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    diff = after.compare_to(before, "lineno")
+    allocated = sum(stat.size_diff for stat in diff if stat.size_diff > 0)
+    blocks = sum(stat.count_diff for stat in diff if stat.count_diff > 0)
+    top = [
+        {"where": str(stat.traceback[0]), "size_diff_kb": round(stat.size_diff / 1024, 2), "count_diff": stat.count_diff}
+        for stat in diff[:5]
+    ]
+    return {
+        "frames": frames,
+        "peak_kb": round(peak / 1024, 2),
+        "retained_kb": round(allocated / 1024, 2),
+        "retained_blocks": blocks,
+        "retained_kb_per_frame": round(allocated / 1024 / frames, 4) if frames else 0.0,
+        "top": top,
+    }
+
+
+def cold_start_child():
+    """Runs in a fresh interpreter: time from process start to the first presented frame"""
+    process_start = time.perf_counter()
+    with contextlib.redirect_stdout(sys.stderr):
+        # Imported here only to time it; setup_game() then finds it in sys.modules
+        import_start = time.perf_counter()
+        importlib.import_module("main")
+        import_ms = (time.perf_counter() - import_start) * 1000
+
+        pygame, main, screen = setup_game(None)
+        from simulation import GameState
+        state = GameState(seed=0, with_sprites=True)
+        main.draw_window(screen, state.bird, state.pipes, state.score, state.hit_count)
+    first_frame_ms = (time.perf_counter() - process_start) * 1000
+    print(json.dumps({"import_main_ms": round(import_ms, 3), "first_frame_ms": round(first_frame_ms, 3)}))
+
+
+def measure_cold_start(runs):
+    """Spawn fresh interpreters and measure wall time to the first frame"""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--cold-start-child"],
+            capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout
+        wall_ms = (time.perf_counter() - start) * 1000
+        child = json.loads(output.strip().splitlines()[-1])
+        child["process_wall_ms"] = round(wall_ms, 3)
+        samples.append(child)
+    keys = samples[0].keys() if samples else []
+    return {key: round(percentile([sample[key] for sample in samples], 50), 3) for key in keys} | {"runs": runs}
+
+
+def run_benchmark(frames, seed, renderer_mode, alloc_frames, cold_runs):
+    timer = FunctionTimer()
+    pygame, main, screen = setup_game(renderer_mode)
+    import text_cache
+    from audio import AudioManager
+    from obstacle import Pipe
+
+    timer.wrap(main, "draw_window")
+    timer.wrap(main, "render_text_with_outline")
+    timer.wrap(text_cache, "render_outlined_text")
+    # Pipes come from a pool, so respawning one is a reset rather than a new Pipe
+    timer.wrap(Pipe, "reset", "Pipe.reset")
+    # Effects decode lazily, so time the decode itself rather than load_sounds()
+    timer.wrap(AudioManager, "_decode", "AudioManager._decode")
+
+    pygame.mixer.init()
+    main.load_sounds().preload(background=False)
+    # The splash/instructions text goes through render_text_with_outline
+    main.render_text_with_outline(text_cache.get_font(main.FONT_PATH, 36), 'Click anywhere to start!',
+                                  main.WHITE, main.BLACK)
+
+    frame_ms, restarts = run_session(main, screen, frames, seed)
+    functions = timer.report()
+    timer.restore()
+
+    result = {
+        "meta": {
+            "seed": seed,
+            "renderer": main.renderer.mode,
+            "screen": [main.SCREEN_WIDTH, main.SCREEN_HEIGHT],
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+            "restarts": restarts,
+        },
+        "frame_time": frame_summary(frame_ms),
+        "functions": functions,
+    }
+    if alloc_frames:
+        result["allocations"] = measure_allocations(main, screen, alloc_frames, seed)
+    if cold_runs:
+        result["cold_start"] = measure_cold_start(cold_runs)
+    return result
+
+
+def compare(baseline, current, threshold):
+    """List timing metrics that regressed by more than threshold (a fraction)"""
+    regressions = []
+
+    def check(name, old, new):
+        if old and new > old * (1 + threshold):
+            regressions.append({"metric": name, "baseline": old, "current": new,
+                                "change_pct": round((new - old) / old * 100, 1)})
+
+    for key in ("p50_ms", "p95_ms", "p99_ms"):
+        check(f"frame_time.{key}", baseline.get("frame_time", {}).get(key), current["frame_time"][key])
+    for name, stats in current.get("functions", {}).items():
+        check(f"functions.{name}.mean_ms", baseline.get("functions", {}).get(name, {}).get("mean_ms"), stats["mean_ms"])
+    for key, value in current.get("cold_start", {}).items():
+        if key != "runs":
+            check(f"cold_start.{key}", baseline.get("cold_start", {}).get(key), value)
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Dark Skies benchmark harness")
+    parser.add_argument("--frames", type=int, default=1200, help="frames in the scripted session")
+    parser.add_argument("--seed", type=int, default=7, help="simulation seed")
+    parser.add_argument("--renderer", choices=("full", "dirty"), help="renderer mode (default: DARK_SKIES_RENDERER)")
+    parser.add_argument("--alloc-frames", type=int, default=300, help="frames traced for allocations (0 disables)")
+    parser.add_argument("--cold-runs", type=int, default=3, help="fresh processes for cold start (0 disables)")
+    parser.add_argument("--output", help="write the JSON result to this file instead of stdout")
+    parser.add_argument("--compare", help="baseline JSON to compare against; exits 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown for --compare (fraction)")
+    parser.add_argument("--cold-start-child", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    # Run from the repo root so the relative asset paths resolve
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    args = parse_args()
+    if args.cold_start_child:
+        cold_start_child()
+        sys.exit(0)
+
+    # Keep stdout clean for the JSON result; the game's own messages go to stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        result = run_benchmark(args.frames, args.seed, args.renderer, args.alloc_frames, args.cold_runs)
+    if args.compare:
+        with open(args.compare) as f:
+            result["regressions"] = compare(json.load(f), result, args.threshold)
+
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if result.get("regressions"):
+        sys.exit(1)
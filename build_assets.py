@@ -0,0 +1,61 @@
+"""
+Asset build step for Dark Skies
+
+Decodes every image the game loads through the asset registry, scales it to the size
+the game draws it at, and writes the raw pixels to the on-disk asset cache
+(DARK_SKIES_ASSET_CACHE, default .asset_cache). Images whose source is unchanged
+since the last build are skipped unless --force is given.
+
+    python build_assets.py
+    python build_assets.py --force
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+
+def build(force=False):
+    """Write every game image to the cache; returns (built, up to date) counts"""
+    import main
+    from asset_registry import registry
+
+    cache = registry.cache
+    if not cache or not cache.enabled:
+        sys.exit("The asset cache is turned off (DARK_SKIES_ASSET_CACHE=0)")
+    images = main.MENU_IMAGES + main.GAMEPLAY_IMAGES + main.parallax_images()
+    game_over_size = registry.size_for_width(main.GAME_OVER_IMG_PATH, main.GAME_OVER_WIDTH)
+    if game_over_size:
+        images.append((main.GAME_OVER_IMG_PATH, game_over_size, True))
+    else:
+        print(f"Skipped {main.GAME_OVER_IMG_PATH}: not a readable PNG")
+    built = 0
+    for path, size, alpha in images:
+        if not force and cache.load(path, size, alpha) is not None:
+            continue
+        start = time.perf_counter()
+        surface = registry.build(path, size, alpha)
+        width, height = surface.get_size()
+        print(f"Built {path} [{width}x{height}] in {(time.perf_counter() - start) * 1000:.1f} ms")
+        built += 1
+    # Entries for images the game no longer uses are dropped with their files
+    cache.save(keep=images)
+    return built, len(images) - built
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Build the Dark Skies asset cache")
+    parser.add_argument("--force", action="store_true", help="rebuild images that are already up to date")
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    # Run from the repo root so the relative asset paths resolve
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    args = parse_args()
+    built, current = build(args.force)
+    print(f"Asset cache: {built} built, {current} up to date")
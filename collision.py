@@ -0,0 +1,58 @@
+from bisect import bisect_left, bisect_right, insort
+from operator import attrgetter
+import pygame
+
+_x = attrgetter('x')
+
+
+def sprites_overlap(rect_a, mask_a, rect_b, mask_b, area=None):
+    """
+    Narrow phase: pixel overlap of two sprites at rect_a and rect_b, counting only pixels inside area if given
+    Falls back to the rects alone when either mask is missing (headless simulations)
+    """
+    overlap = rect_a.clip(rect_b)
+    if area is not None:
+        overlap = overlap.clip(area)
+    if not overlap.width or not overlap.height:
+        return False
+    if mask_a is None or mask_b is None:
+        return True
+    offset = (rect_b.x - rect_a.x, rect_b.y - rect_a.y)
+    if area is None:
+        return mask_a.overlap(mask_b, offset) is not None
+    # Only reached when the rects touch inside area, so the temporary masks are rare
+    touching = mask_a.overlap_mask(mask_b, offset)
+    window = pygame.Mask(overlap.size, fill=True)
+    return touching.overlap(window, (overlap.x - rect_a.x, overlap.y - rect_a.y)) is not None
+
+
+class SweepAndPrune:
+    """
+    Broad phase: obstacles kept sorted by x, so the ones near an x range are found by binary search
+    Each obstacle covers [x + min_offset, x + max_offset] horizontally. The list is
+    shared with the caller, who must add obstacles through add() or call resort()
+    after moving obstacles at different speeds.
+    """
+
+    def __init__(self, items, min_offset=0, max_offset=0):
+        self.items = items
+        self.min_offset = min_offset
+        self.max_offset = max_offset
+        self.resort()
+
+    def add(self, item):
+        insort(self.items, item, key=_x)
+
+    def resort(self):
+        # Already (nearly) sorted most of the time, which timsort handles in linear time
+        self.items.sort(key=_x)
+
+    def near(self, left, right):
+        """Obstacles whose horizontal extent overlaps [left, right)"""
+        lo = bisect_left(self.items, left - self.max_offset, key=_x)
+        hi = bisect_right(self.items, right - self.min_offset, key=_x)
+        return self.items[lo:hi]
+
+    def left_of(self, x):
+        """Number of obstacles (at the front of the list) whose x is below x"""
+        return bisect_left(self.items, x, key=_x)
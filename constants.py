@@ -1,14 +1,73 @@
-SCREEN_WIDTH = 400
-SCREEN_HEIGHT = 600
-BIRD_WIDTH = 34
-BIRD_HEIGHT = 24
+import os
+import struct
+
+# Sprite paths
+ASTEROID_IMG_PATH = "assets/Asteroids/Asteroid Large.png"
+ASTEROID_SMALL_IMG_PATH = "assets/Asteroids/Asteroid Small.png"
+BUG_IMG_PATH = "assets/BUG.png"
+ERROR_IMG_PATH = "assets/Error.png"
+VAN_IMG_PATH = "assets/sprites/LD VAN.png"
+CRASHED_VAN_IMG_PATH = "assets/sprites/LD Crashed Van.png"
+GAME_OVER_IMG_PATH = "assets/Game Over Text.png"
+
+BKG_IMG_PATH = "assets/Tile Galaxy BK - 1080x1920.png"
+PARALLAX_IMG_PATH = "assets/Tile Galaxy BK - 3480x999.png"
+
+
+def png_size(path):
+    """Read (width, height) from a PNG's IHDR header without decoding the image (None if not a PNG)"""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(24)
+    except OSError:
+        return None
+    if len(header) < 24 or header[:8] != b"\x89PNG\r\n\x1a\n" or header[12:16] != b"IHDR":
+        return None
+    return struct.unpack(">II", header[16:24])
+
+
+# (width, height) of the background image, or None if its header can't be read
+BKG_SOURCE_SIZE = png_size(BKG_IMG_PATH)
+if BKG_SOURCE_SIZE:
+    # Use a reasonable game window size based on the background
+    bg_width, bg_height = BKG_SOURCE_SIZE
+    if bg_width > bg_height:  # Landscape background
+        SCREEN_WIDTH = min(1200, bg_width)  # Cap at reasonable size
+        SCREEN_HEIGHT = int(SCREEN_WIDTH * (bg_height / bg_width))
+    else:  # Portrait background
+        SCREEN_HEIGHT = min(800, bg_height)  # Cap at reasonable size  
+        SCREEN_WIDTH = int(SCREEN_HEIGHT * (bg_width / bg_height))
+else:
+    SCREEN_WIDTH = 800
+    SCREEN_HEIGHT = 600
+
+# Game Constants
+BIRD_WIDTH = 133
+BIRD_HEIGHT = 76
 PIPE_WIDTH = 52
 PIPE_HEIGHT = 320
-PIPE_GAP = 150
+PIPE_GAP = 250
+PIPE_SPEED = 3
+PIPE_SPACING = 500  # horizontal distance between pipes
+ASTEROID_LARGE_SIZE = 80
+ASTEROID_SMALL_SIZE = 50
+ERROR_SIZE = 40
+BUG_SIZE = 40
+MAX_HITS = 10
 GRAVITY = 0.25
 JUMP_STRENGTH = -6.5
-FPS = 60
+# Rendering and physics rates can be set separately; physics runs in fixed steps
+FPS = int(os.getenv("DARK_SKIES_FPS", "60"))
+PHYSICS_HZ = int(os.getenv("DARK_SKIES_PHYSICS_HZ", "60"))
+TICK_RATE = 60  # movement constants above are per 1/TICK_RATE s
+# Scrolling parallax background instead of the static one (opt-in)
+PARALLAX = os.getenv("DARK_SKIES_PARALLAX", "0") == "1"
+# (path, speed) of each parallax layer, back to front; speed is relative to the obstacles
+PARALLAX_LAYERS = ((PARALLAX_IMG_PATH, 0.5),)
+MAX_FRAME_TIME = 0.25  # longest frame time fed to the physics after a stall, in seconds
+IDLE_FPS = 10  # tick rate of the menu and game over screens, which only redraw on input
+
+# Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 GREEN = (0, 200, 0)
-
@@ -6,38 +6,257 @@
 import ldclient
 from ldclient.config import Config
 from ldclient import Context
+from ldclient.interfaces import DataSourceState
+from ldclient.integrations import Files
 import os
 import logging
+import threading
 
 # configure logging for LD
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# default seconds the SDK may spend connecting before the game carries on with defaults
+DEFAULT_START_WAIT = 5.0
+
+# SDK key placeholder for file data source mode, where no key is needed
+OFFLINE_SDK_KEY = "dark-skies-offline"
+
+# seconds between checks for a changed flag data file
+DATA_FILE_POLL_INTERVAL = 1.0
+
+# every flag the game evaluates, with its default value
+GAME_FLAGS = {
+    "mute-sound-dark-skies": False,
+    "trivia-easy-enabled": True,
+    "trivia-medium-enabled": True,
+    "trivia-hard-enabled": True,
+}
+
+TRIVIA_DIFFICULTY_FLAGS = (
+    ("easy", "trivia-easy-enabled"),
+    ("medium", "trivia-medium-enabled"),
+    ("hard", "trivia-hard-enabled"),
+)
+
+class FlagSnapshot:
+    """
+    In-memory flag values for one context
+    All flags are evaluated together with one all_flags_state call; flags reported as
+    changed are marked stale and re-evaluated individually on their next lookup.
+    """
+
+    def __init__(self, client, context):
+        self.client = client
+        self.context = context
+        self._values = {}
+        self._stale = set()
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self):
+        """Evaluate every flag for this context in one pass; returns True if any value changed"""
+        state = self.client.all_flags_state(self.context)
+        if not state.valid:
+            raise RuntimeError("all_flags_state returned an invalid snapshot")
+        values = state.to_values_map()
+        with self._lock:
+            changed = values != self._values
+            self._values = values
+            self._stale.clear()
+        return changed
+
+    def invalidate(self, flag_key):
+        """Mark one flag for re-evaluation on its next lookup"""
+        with self._lock:
+            self._stale.add(flag_key)
+
+    def get(self, flag_key, default):
+        with self._lock:
+            stale = flag_key in self._stale
+            value = self._values.get(flag_key, default)
+        if not stale:
+            return value
+        value = self.client.variation(flag_key, self.context, default)
+        with self._lock:
+            self._values[flag_key] = value
+            self._stale.discard(flag_key)
+        return value
+
 class LaunchDarklyClient:
-    def __init__(self, sdk_key=None):
+    def __init__(self, sdk_key=None, start_wait=None, blocking=False, data_file=None):
         """
         Initialize LaunchDarkly client
         SDK key can be passed directly or set as environment variable LD_SDK_KEY
+        data_file (or LD_DATA_FILE) reads flags from a local JSON file instead of the
+        LaunchDarkly service and reloads it when the file changes
+        The SDK connects on a background thread so the game can draw right away;
+        flag lookups return their defaults until it reports initialized.
+        start_wait (or LD_START_WAIT) is the startup deadline in seconds, and
+        blocking=True waits for it before returning.
         """
         self.sdk_key = sdk_key or os.getenv('LD_SDK_KEY')
+        self.data_file = data_file or os.getenv('LD_DATA_FILE')
+        if start_wait is None:
+            start_wait = float(os.getenv('LD_START_WAIT', DEFAULT_START_WAIT))
+        self.start_wait = start_wait
         self.client = None
-        self.is_initialized = False
+        self._ready = threading.Event()
+        self._ready_listeners = []
+        self._lock = threading.Lock()
+        self._contexts = {}
+        self._snapshots = {}
+        # set whenever flag values may have changed (initialization, flag updates)
+        self.flags_updated = threading.Event()
+        self._init_thread = None
+        self._closed = threading.Event()
         
-        if self.sdk_key:
-            try:
-                ldclient.set_config(Config(self.sdk_key))
-                self.client = ldclient.get()
-                self.is_initialized = True
-                logger.info("LaunchDarkly client initialized successfully")
-            except Exception as e:
-                logger.error(f"Failed to initialize LaunchDarkly client: {e}")
-                self.is_initialized = False
+        if self.data_file:
+            logger.info(f"Using LaunchDarkly flag data from {self.data_file}")
+        if self.sdk_key or self.data_file:
+            self._init_thread = threading.Thread(target=self._initialize, name="launchdarkly-init", daemon=True)
+            self._init_thread.start()
+            if blocking:
+                self.wait_until_ready(self.start_wait)
         else:
             logger.warning("No LaunchDarkly SDK key provided. Using default values.")
+
+    @property
+    def is_initialized(self):
+        """True once the SDK has received flag data"""
+        return self._ready.is_set()
+
+    def _initialize(self):
+        """Connect the SDK (runs on the init thread)"""
+        try:
+            ldclient.start_wait = self.start_wait
+            ldclient.set_config(self._build_config())
+            client = ldclient.get()
+        except Exception as e:
+            logger.error(f"Failed to initialize LaunchDarkly client: {e}")
+            return
+        self.client = client
+
+        # flag changes only invalidate the affected entries of the cached snapshots
+        client.flag_tracker.add_listener(self._on_flag_change)
+
+        # the SDK keeps retrying after the deadline; apply flags as soon as it gets data
+        client.data_source_status_provider.add_listener(self._on_data_source_status)
+        if self.data_file:
+            threading.Thread(target=self._watch_data_file, name="launchdarkly-data-file", daemon=True).start()
+
+        if client.is_initialized():
+            self._mark_ready()
+        else:
+            logger.warning(f"LaunchDarkly not ready after {self.start_wait}s, using default values until it connects")
+
+    def _build_config(self):
+        if not self.data_file:
+            return Config(self.sdk_key)
+        # Local flag file, no network: no streaming connection and no analytics events
+        data_source = Files.new_data_source(paths=[self.data_file], auto_update=True)
+        return Config(self.sdk_key or OFFLINE_SDK_KEY, update_processor_class=data_source, send_events=False)
+
+    def _on_data_source_status(self, status):
+        if status.state == DataSourceState.VALID:
+            self._mark_ready()
+
+    def _watch_data_file(self):
+        """
+        Refresh cached snapshots after the SDK reloads the flag file (runs on its own thread)
+        Flag files rarely bump flag versions, so the SDK does not report which flags
+        changed on a reload; compare fresh snapshots against the cached values instead
+        """
+        while not self._closed.wait(DATA_FILE_POLL_INTERVAL):
+            with self._lock:
+                snapshots = list(self._snapshots.values())
+            changed = False
+            for snapshot in snapshots:
+                try:
+                    changed = snapshot.refresh() or changed
+                except Exception as e:
+                    logger.error(f"Error refreshing flags from {self.data_file}: {e}")
+            if changed:
+                logger.info(f"LaunchDarkly flag data reloaded from {self.data_file}")
+                self.flags_updated.set()
+
+    def _on_flag_change(self, change):
+        with self._lock:
+            snapshots = list(self._snapshots.values())
+        for snapshot in snapshots:
+            snapshot.invalidate(change.key)
+        logger.info(f"LaunchDarkly flag changed: {change.key}")
+        self.flags_updated.set()
+
+    def _mark_ready(self):
+        with self._lock:
+            if self._ready.is_set():
+                return
+            self._ready.set()
+            listeners = list(self._ready_listeners)
+        logger.info("LaunchDarkly client initialized successfully")
+        self.flags_updated.set()
+        for listener in listeners:
+            try:
+                listener()
+            except Exception as e:
+                logger.error(f"Error in LaunchDarkly ready listener: {e}")
+
+    def add_ready_listener(self, listener):
+        """
+        Call listener() once the SDK is initialized (immediately if it already is)
+        Listeners run on the SDK's thread, so they should only hand work to the game loop
+        """
+        with self._lock:
+            if not self._ready.is_set():
+                self._ready_listeners.append(listener)
+                return
+        listener()
+
+    def wait_until_ready(self, timeout=None):
+        """Block until the SDK is initialized or timeout seconds pass; returns readiness"""
+        return self._ready.wait(timeout)
     
     def get_user_context(self, user_key="demo-player-001"):
-        """Create a user context for flag evaluation"""
-        return Context.builder(user_key).kind('user').name('Dark Skies Player').set('game', 'dark-skies').set('version', '1.0').build()
+        """Create a user context for flag evaluation (built once per player)"""
+        context = self._contexts.get(user_key)
+        if context is None:
+            context = Context.builder(user_key).kind('user').name('Dark Skies Player').set('game', 'dark-skies').set('version', '1.0').build()
+            self._contexts[user_key] = context
+        return context
+
+    def get_flag_snapshot(self, user_context=None):
+        """
+        Return the cached flag snapshot for a context, evaluating all flags on first use
+        Returns None until the SDK is initialized
+        """
+        if not self.is_initialized:
+            return None
+        if user_context is None:
+            user_context = self.get_user_context()
+        with self._lock:
+            snapshot = self._snapshots.get(user_context.fully_qualified_key)
+        if snapshot is None:
+            snapshot = FlagSnapshot(self.client, user_context)
+            with self._lock:
+                self._snapshots[user_context.fully_qualified_key] = snapshot
+        return snapshot
+
+    def get_flag(self, flag_key, default=None, user_context=None):
+        """
+        Look up a flag value from memory; cheap enough to call every frame
+        Returns default until the SDK is initialized or if evaluation fails
+        """
+        if default is None:
+            default = GAME_FLAGS.get(flag_key)
+        try:
+            snapshot = self.get_flag_snapshot(user_context)
+            if snapshot is None:
+                return default
+            return snapshot.get(flag_key, default)
+        except Exception as e:
+            logger.error(f"Error evaluating {flag_key} flag: {e}")
+            return default
     
     def should_mute_sound(self, user_context=None):
         """
@@ -45,16 +264,9 @@ class LaunchDarklyClient:
         Flag: mute-sound (boolean)
         Default: False (sound enabled)
         """
-        if user_context is None:
-            user_context = self.get_user_context()
-        
-        try:
-            flag_value = self.client.variation("mute-sound-dark-skies", user_context, False)
-            logger.info(f"mute-sound-dark-skies flag returned: {flag_value}")
-            return flag_value
-        except Exception as e:
-            logger.error(f"Error evaluating mute-sound flag: {e}")
-            return False
+        flag_value = self.get_flag("mute-sound-dark-skies", False, user_context)
+        logger.debug(f"mute-sound-dark-skies flag returned: {flag_value}")
+        return flag_value
     
     def get_enabled_trivia_difficulties(self, user_context=None):
         """
@@ -62,30 +274,18 @@ class LaunchDarklyClient:
         Flags: trivia-easy-enabled, trivia-medium-enabled, trivia-hard-enabled
         Returns: list of enabled difficulty levels
         """
-        if user_context is None:
-            user_context = self.get_user_context()
-        
-        enabled_difficulties = []
+        # check each difficulty for flag
+        enabled_difficulties = [
+            difficulty for difficulty, flag_key in TRIVIA_DIFFICULTY_FLAGS
+            if self.get_flag(flag_key, True, user_context)
+        ]
         
-        try:
-            # check each difficulty for flag
-            if self.client.variation("trivia-easy-enabled", user_context, True):
-                enabled_difficulties.append("easy")
-            if self.client.variation("trivia-medium-enabled", user_context, True):
-                enabled_difficulties.append("medium")
-            if self.client.variation("trivia-hard-enabled", user_context, True):
-                enabled_difficulties.append("hard")
-            
-            # fallback: if no difficulties are enabled, enable all
-            if not enabled_difficulties:
-                logger.warning("No trivia difficulties enabled, falling back to all difficulties")
-                enabled_difficulties = ["easy", "medium", "hard"]
-                
-        except Exception as e:
-            logger.error(f"Error evaluating trivia difficulty flags: {e}")
+        # fallback: if no difficulties are enabled, enable all
+        if not enabled_difficulties:
+            logger.warning("No trivia difficulties enabled, falling back to all difficulties")
             enabled_difficulties = ["easy", "medium", "hard"]
         
-        logger.info(f"Enabled trivia difficulties: {enabled_difficulties}")
+        logger.debug(f"Enabled trivia difficulties: {enabled_difficulties}")
         return enabled_difficulties
     
     def filter_trivia_by_difficulty(self, trivia_data, user_context=None):
@@ -109,6 +309,9 @@ class LaunchDarklyClient:
     
     def close(self):
         """Close the LaunchDarkly client"""
+        self._closed.set()
+        if self._init_thread and self._init_thread.is_alive():
+            self._init_thread.join(timeout=1.0)
         if self.client:
             try:
                 self.client.close()
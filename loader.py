@@ -0,0 +1,69 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class AssetLoader:
+    """
+    Runs loading tasks on worker threads while the menus are showing
+    Tasks are added with add() and started together with start(). progress() reports
+    how many have finished, and wait() is the readiness barrier: it blocks until every
+    task is done and returns their results by name. Work that must happen on the main
+    thread (such as converting surfaces for the display) belongs after wait().
+    """
+
+    def __init__(self, workers=2):
+        self.workers = workers
+        self._tasks = []
+        self._futures = {}
+        self._done = 0
+        self._lock = threading.Lock()
+        self._executor = None
+        self._started_at = None
+
+    def add(self, name, function, *args, **kwargs):
+        self._tasks.append((name, function, args, kwargs))
+
+    def start(self):
+        """Submit every task to the worker pool (once)"""
+        if self._executor is not None:
+            return
+        self._started_at = time.perf_counter()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="asset-loader")
+        for name, function, args, kwargs in self._tasks:
+            future = self._executor.submit(function, *args, **kwargs)
+            future.add_done_callback(self._task_done)
+            self._futures[name] = future
+
+    def _task_done(self, future):
+        with self._lock:
+            self._done += 1
+
+    def progress(self):
+        """(finished, total) task counts"""
+        return self._done, len(self._tasks)
+
+    @property
+    def ready(self):
+        return self._executor is not None and self._done == len(self._tasks)
+
+    def wait(self, timeout=None):
+        """
+        Block until every task has finished and return {name: result}
+        A task that failed is reported and its result is None, so the game can fall back
+        to loading that asset on demand.
+        """
+        self.start()
+        wait_start = time.perf_counter()
+        results = {}
+        for name, future in self._futures.items():
+            try:
+                results[name] = future.result(timeout)
+            except Exception as e:
+                print(f"Error loading {name}: {e}")
+                results[name] = None
+        self._executor.shutdown(wait=False)
+        now = time.perf_counter()
+        print(f"Assets ready: {len(self._tasks)} tasks in {(now - self._started_at) * 1000:.0f} ms, "
+              f"waited {(now - wait_start) * 1000:.0f} ms")
+        return results
@@ -3,46 +3,24 @@ import pygame
 import sys
 import random
 import os
-import json
 from modals import Modal
 from launchdarkly_client import LaunchDarklyClient
-ASTEROID_IMG_PATH = "assets/Asteroids/Asteroid Large.png"
-BUG_IMG_PATH = "assets/BUG.png"
-ERROR_IMG_PATH = "assets/Error.png"
-
-BKG_IMG_PATH = "assets/Tile Galaxy BK - 1080x1920.png"
-if os.path.exists(BKG_IMG_PATH):
-    _bkg_img = pygame.image.load(BKG_IMG_PATH)
-    # Use a reasonable game window size based on the background
-    bg_width, bg_height = _bkg_img.get_size()
-    if bg_width > bg_height:  # Landscape background
-        SCREEN_WIDTH = min(1200, bg_width)  # Cap at reasonable size
-        SCREEN_HEIGHT = int(SCREEN_WIDTH * (bg_height / bg_width))
-    else:  # Portrait background
-        SCREEN_HEIGHT = min(800, bg_height)  # Cap at reasonable size  
-        SCREEN_WIDTH = int(SCREEN_HEIGHT * (bg_width / bg_height))
-    del _bkg_img
-else:
-    SCREEN_WIDTH = 800
-    SCREEN_HEIGHT = 600
-
-# Game Constants
+from render_cache import BackgroundCache, ParallaxBackground, ParallaxLayer, fitted_size
+from asset_registry import registry
+from text_cache import text_cache, get_font, CachedLabel
+from renderer import create_renderer
+from simulation import GameState, JUMP, EVENT_TRIVIA
+from trivia_store import TriviaStore
+from audio import AudioManager
+from loader import AssetLoader
+from profiler import profiler, perf_hud, configure_from_env as configure_profiler
+from atlas import GAME_SPRITES
+from constants import (png_size, SCREEN_WIDTH, SCREEN_HEIGHT, BKG_IMG_PATH, BKG_SOURCE_SIZE, GAME_OVER_IMG_PATH,
+                       PARALLAX, PARALLAX_LAYERS, MAX_HITS, FPS, IDLE_FPS, PHYSICS_HZ, TICK_RATE, MAX_FRAME_TIME,
+                       WHITE, BLACK)
 
 # global mute state controlled by LD
 is_muted = False
-BIRD_WIDTH = 133
-BIRD_HEIGHT = 76
-PIPE_WIDTH = 52
-PIPE_HEIGHT = 320
-PIPE_GAP = 250
-GRAVITY = 0.25
-JUMP_STRENGTH = -6.5
-FPS = 60
-
-# Colors
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-GREEN = (0, 200, 0)
 
 # Load custom fonts
 FONT_PATH = "assets/Fonts/Everything else/PixelDigivolve-mOm9.ttf"
@@ -55,362 +33,217 @@ SCORE_SOUND_PATH = "assets/sounds/score.wav"
 GAME_OVER_SOUND_PATH = "assets/sounds/game_over.wav"
 BACKGROUND_MUSIC_PATH = "assets/sounds/background.wav"
 
-class Bird:
-    def __init__(self):
-        self.x = 50
-        self.y = SCREEN_HEIGHT // 2
-        self.width = BIRD_WIDTH
-        self.height = BIRD_HEIGHT
-        self.velocity = 0
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        self.wing_up = True
-        self.animation_counter = 0
-        # Load van images and scale to bird size
-        self.image_normal = pygame.image.load("assets/sprites/LD VAN.png").convert_alpha()
-        self.image_normal = pygame.transform.smoothscale(self.image_normal, (self.width, self.height))
-        # Always re-scale crashed van to match normal van size
-        crashed_img = pygame.image.load("assets/sprites/LD Crashed Van.png").convert_alpha()
-        self.image_crashed = pygame.transform.smoothscale(crashed_img, (self.width, self.height))
-        self.rect.width = self.width
-        self.rect.height = self.height
-
-    def jump(self):
-        self.velocity = JUMP_STRENGTH
-
-    def move(self):
-        self.velocity += GRAVITY
-        self.y += self.velocity
-        self.rect.y = int(self.y)
-        # Animate wing
-        self.animation_counter += 1
-        if self.animation_counter % 7 == 0:
-            self.wing_up = not self.wing_up
-
-    def draw(self, screen, crashed=False):
-        # Draw the van image at the bird's position
-        if crashed:
-            screen.blit(self.image_crashed, (self.rect.x, self.rect.y))
-        else:
-            screen.blit(self.image_normal, (self.rect.x, self.rect.y))
-
-class Pipe:
-    def __init__(self, x):
-        self.x = x
-        self.height = random.randint(50, SCREEN_HEIGHT - PIPE_GAP - 50)
-        self.top_rect = pygame.Rect(self.x, 0, PIPE_WIDTH, self.height)
-        self.bottom_rect = pygame.Rect(self.x, self.height + PIPE_GAP, PIPE_WIDTH, SCREEN_HEIGHT - self.height - PIPE_GAP)
-        self.gap_rect = pygame.Rect(self.x, self.height, PIPE_WIDTH, PIPE_GAP)
-        # Use asteroids as main obstacles
-        asteroid_large_img = pygame.image.load("assets/Asteroids/Asteroid Large.png").convert_alpha()
-        asteroid_small_img = pygame.image.load("assets/Asteroids/Asteroid Small.png").convert_alpha()
-        # Scale asteroids to appropriate sizes
-        self.asteroid_large = pygame.transform.smoothscale(asteroid_large_img, (80, 80))
-        self.asteroid_small = pygame.transform.smoothscale(asteroid_small_img, (50, 50))
-        # Load error symbol for single placement (not tiled)
-        self.error_img = pygame.image.load(ERROR_IMG_PATH).convert_alpha()
-        self.error_img = pygame.transform.smoothscale(self.error_img, (40, 40))
-        # Choose asteroids for obstacles
-        self.top_asteroids = self._generate_asteroid_pattern(self.top_rect)
-        self.bottom_asteroids = self._generate_asteroid_pattern(self.bottom_rect)
-        # Add single error symbol in varying position
-        self.error_positions = self._generate_error_positions()
-
-    def _generate_asteroid_pattern(self, rect):
-        """Generate asteroid positions to fill the obstacle area"""
-        asteroids = []
-        y = rect.y
-        while y < rect.y + rect.height:
-            # Randomly choose asteroid size
-            if random.random() < 0.6:  # 60% chance for large asteroid
-                asteroid_img = self.asteroid_large
-                size = 80
-            else:
-                asteroid_img = self.asteroid_small  
-                size = 50
-            
-            # Add some random horizontal offset for variety
-            x_offset = random.randint(-10, 10)
-            asteroids.append({
-                'img': asteroid_img,
-                'x': rect.x + x_offset,
-                'y': y,
-                'size': size
-            })
-            y += size - 10  # Slight overlap for better coverage
-        return asteroids
-
-    def _generate_error_positions(self):
-        """Generate single error symbol positions in varying locations"""
-        error_positions = []
-        # Add one error symbol to top or bottom area (randomly)
-        # Make sure we have valid ranges for positioning
-        error_size = 40  # Size of error image
-        max_x = max(10, PIPE_WIDTH - error_size)
-        min_x = 5
-        
-        # This modification display the symbol at the middle of the gap.
-        x = self.gap_rect.x + (PIPE_WIDTH / 2)
-        y = self.gap_rect.y + (PIPE_GAP / 2)
-        error_positions.append({'x': x, 'y': y})
-        # if random.random() < 0.5 and self.top_rect.height > error_size:
-        #     # Place in top area
-        #     x = self.x + random.randint(min_x, max_x)
-        #     max_y = max(self.top_rect.y + 10, self.top_rect.y + self.top_rect.height - error_size)
-        #     min_y = self.top_rect.y + 10
-        #     if max_y > min_y:
-        #         y = random.randint(min_y, max_y)
-        #         error_positions.append({'x': x, 'y': y})
-        # elif self.bottom_rect.height > error_size:
-        #     # Place in bottom area
-        #     x = self.x + random.randint(min_x, max_x)
-        #     max_y = max(self.bottom_rect.y + 10, self.bottom_rect.y + self.bottom_rect.height - error_size)
-        #     min_y = self.bottom_rect.y + 10
-        #     if max_y > min_y:
-        #         y = random.randint(min_y, max_y)
-        #         error_positions.append({'x': x, 'y': y})
-        return error_positions
-
-    def move(self):
-        self.x -= 3
-        self.top_rect.x = self.x
-        self.bottom_rect.x = self.x
-        self.gap_rect.x = self.x
-        # Update asteroid positions
-        for asteroid in self.top_asteroids:
-            asteroid['x'] = self.x + (asteroid['x'] - (self.x + 3))
-        for asteroid in self.bottom_asteroids:
-            asteroid['x'] = self.x + (asteroid['x'] - (self.x + 3))
-        # Update error positions
-        for error_pos in self.error_positions:
-            error_pos['x'] -= 3
-
-    def draw(self, screen):
-        # Draw asteroids in top area
-        for asteroid in self.top_asteroids:
-            screen.blit(asteroid['img'], (asteroid['x'], asteroid['y']))
-        
-        # Draw asteroids in bottom area  
-        for asteroid in self.bottom_asteroids:
-            screen.blit(asteroid['img'], (asteroid['x'], asteroid['y']))
-            
-        # Draw single error symbols in varying positions
-        for error_pos in self.error_positions:
-            screen.blit(self.error_img, (error_pos['x'], error_pos['y']))
+# Shared audio manager; decoded effects survive restarts
+audio = AudioManager({
+    'jump': JUMP_SOUND_PATH,
+    'hit': HIT_SOUND_PATH,
+    'score': SCORE_SOUND_PATH,
+    'game_over': GAME_OVER_SOUND_PATH
+}, BACKGROUND_MUSIC_PATH, effect_volume=0.7, music_volume=0.5)
 
-    def off_screen(self):
-        return self.x < -PIPE_WIDTH
+# Trivia bank: a .json list, or a .jsonl file (one question per line) for large banks
+TRIVIA_PATH = os.getenv("DARK_SKIES_TRIVIA_PATH", "assets/trivia.json")
 
-    def collide(self, bird):
-        return self.top_rect.colliderect(bird.rect) or self.bottom_rect.colliderect(bird.rect)
-
-    def hit_symbol(self, bird):
-        return self.gap_rect.colliderect(bird.rect)
+# Backgrounds are scaled once per screen size instead of every frame
+gameplay_background = BackgroundCache(preserve_aspect=True, smooth=True, fill_color=BLACK)
+# Scrolling layers drawn instead of gameplay_background when DARK_SKIES_PARALLAX=1 (built in main)
+parallax_background = None
+splash_background = BackgroundCache(preserve_aspect=False, smooth=False)
 
+# Full redraw or dirty rectangles, chosen with DARK_SKIES_RENDERER (F2 toggles in game)
+renderer = create_renderer()
 
 
 def load_sounds():
-    """Load all sound effects safely with error handling"""
-    sounds = {}
-    sound_files = {
-        'jump': JUMP_SOUND_PATH,
-        'hit': HIT_SOUND_PATH,
-        'score': SCORE_SOUND_PATH,
-        'game_over': GAME_OVER_SOUND_PATH
-    }
-    
-    for sound_name, sound_path in sound_files.items():
-        try:
-            if sound_path and os.path.exists(sound_path):
-                sounds[sound_name] = pygame.mixer.Sound(sound_path)
-                print(f"Loaded sound: {sound_name}")
-            else:
-                if sound_path:
-                    print(f"Sound file not found: {sound_path}")
-                else:
-                    print(f"Sound disabled: {sound_name}")
-                sounds[sound_name] = None
-        except pygame.error as e:
-            print(f"Error loading sound {sound_name}: {e}")
-            sounds[sound_name] = None
-    
-    return sounds
+    """
+    Return the shared, lazy audio manager (the effects are registered when it is created)
+    Effects decode on first use (or in the background once gameplay starts), and
+    stay cached across restarts; nothing is decoded while sound is muted
+    """
+    return audio
 
 def load_background_music():
-    """Load and start background music"""
-    try:
-        if os.path.exists(BACKGROUND_MUSIC_PATH):
-            pygame.mixer.music.load(BACKGROUND_MUSIC_PATH)
-            if is_muted:
-                pygame.mixer.music.set_volume(0.0)  # muted
-            else:
-                pygame.mixer.music.set_volume(0.5)  # Set volume to 50%
-            pygame.mixer.music.play(-1)  # Loop indefinitely
-            print("Background music loaded and playing")
-        else:
-            print(f"Background music file not found: {BACKGROUND_MUSIC_PATH}")
-    except pygame.error as e:
-        print(f"Error loading background music: {e}")
+    """Start streaming the background music (skipped while muted)"""
+    audio.start_music()
 
 def play_sound(sounds, sound_name, volume=1.0):
     """Play a sound effect if it exists and not muted"""
-    if is_muted:
-        return  # don't play any sounds if muted by LD
-    if sounds.get(sound_name):
-        sound = sounds[sound_name]
-        sound.set_volume(volume)
-        sound.play()
+    sounds.play(sound_name, volume)
 
 def set_sound_volume(sounds, volume):
     """Set volume for all sound effects (0.0 to 1.0)"""
-    for sound in sounds.values():
-        if sound:
-            sound.set_volume(volume)
+    sounds.set_effect_volume(volume)
+
+SPLASH_IMG_PATH = "assets/START SCREEN.png"
+# The gameplay background scaled to fit the window, as gameplay_background draws it
+BACKGROUND_SIZE = fitted_size(BKG_SOURCE_SIZE or (SCREEN_WIDTH, SCREEN_HEIGHT), (SCREEN_WIDTH, SCREEN_HEIGHT))
+
+# (path, size, alpha) of each image gameplay asks the registry for, at the size it is drawn;
+# build_assets.py writes these (and the splash screen and parallax layers) to the on-disk asset cache
+GAMEPLAY_IMAGES = [
+    (BKG_IMG_PATH, BACKGROUND_SIZE, False),
+    # Sprites packed into the sprite atlas
+    *((path, size, True) for _, path, size in GAME_SPRITES),
+]
+# The game over image is scaled to the overlay width; its size is read from the PNG header when needed
+GAME_OVER_WIDTH = SCREEN_WIDTH - 100  # same margin as build_game_over_overlay
+MENU_IMAGES = [
+    (SPLASH_IMG_PATH, None, False),
+]
+
+def parallax_images(height=SCREEN_HEIGHT):
+    """
+    (path, size, alpha) of each parallax layer scaled to height
+    Layers whose PNG header can't be read are skipped
+    """
+    images = []
+    for path, _ in PARALLAX_LAYERS:
+        source_size = png_size(path)
+        if source_size is None:
+            print(f"Skipping parallax layer {path}: not a readable PNG")
+            continue
+        images.append((path, ParallaxLayer.scaled_size(source_size, height), False))
+    return images
+
+def start_asset_loader():
+    """Start decoding the gameplay images and trivia on worker threads"""
+    loader = AssetLoader()
+    for path, size, alpha in GAMEPLAY_IMAGES + (parallax_images() if PARALLAX else []):
+        loader.add(path, registry.prefetch, path, size, alpha)
+    # Fails if the image can't be read, and the game over overlay falls back to text
+    loader.add(GAME_OVER_IMG_PATH, registry.prefetch, GAME_OVER_IMG_PATH, width=GAME_OVER_WIDTH)
+    loader.add("trivia", load_trivia)
+    loader.start()
+    return loader
 
 def load_trivia():
-    """Load trivia questions from JSON file and filter by enabled difficulties"""
-    with open("assets/trivia.json", "r") as f:
-        trivia_data = json.load(f)
-    
-    # filter trivia based on LD flags
-    return trivia_data
+    """Load trivia questions into a store indexed by difficulty and tag"""
+    return TriviaStore.load(TRIVIA_PATH)
+
+def filter_trivia_by_client(trivia_store, ld_client):
+    """Select trivia based on LaunchDarkly client (called from main), without copying questions"""
+    difficulties = ld_client.get_enabled_trivia_difficulties() if ld_client else None
+    selection = trivia_store.select(difficulties)
+    print(f"Trivia: {len(selection)} questions from {len(trivia_store)} total")
+    return selection
+
+def apply_sound_flags(ld_client, sounds):
+    """Set the global mute state and volumes from the LD mute flag"""
+    global is_muted
+    muted = bool(ld_client and ld_client.should_mute_sound())
+    if muted == is_muted and sounds.muted == muted:
+        return
+    is_muted = muted
+    # muting also covers background music; unmuting starts anything skipped while muted
+    sounds.set_muted(is_muted)
+    if is_muted:
+        print("Sound muted by LaunchDarkly flag")
+    else:
+        print("Sound enabled")
 
-def filter_trivia_by_client(trivia_data, ld_client):
-    """Filter trivia based on LaunchDarkly client (called from main)"""
-    if ld_client:
-        trivia_data = ld_client.filter_trivia_by_difficulty(trivia_data)
-    
-    return trivia_data
+def apply_flag_updates(ld_client, sounds, state=None, trivia_store=None):
+    """
+    Re-apply LD flag values once the client reports new data
+    LD connects in the background, so the game starts on defaults and switches live
+    """
+    if not ld_client or not ld_client.flags_updated.is_set():
+        return
+    ld_client.flags_updated.clear()
+    apply_sound_flags(ld_client, sounds)
+    if state is not None and trivia_store is not None:
+        state.trivia_data = filter_trivia_by_client(trivia_store, ld_client)
 
 def show_trivia_modal(screen, clock, trivia_text):
-    """Display a trivia modal that waits for user input"""
-    waiting = True
-    while waiting:
-        clock.tick(FPS)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
-                waiting = False
-        
-        # Dim the background
-        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # semi-transparent black
-        screen.blit(overlay, (0, 0))
-
-        # Create modal box
-        font = pygame.font.Font(FONT_PATH, 32)
-        wrapped_text = wrap_text(trivia_text, font, screen.get_width() - 80)
-        box_height = 80 + len(wrapped_text) * 35  # Extra space for instruction text
-        box_rect = pygame.Rect(40, screen.get_height() // 2 - box_height // 2, screen.get_width() - 80, box_height)
-        
-        # Draw modal box with dark background for white text
-        pygame.draw.rect(screen, (40, 40, 40), box_rect, border_radius=10)
-        pygame.draw.rect(screen, WHITE, box_rect, 2, border_radius=10)
-
-        # Draw trivia text
-        for i, line in enumerate(wrapped_text):
-            rendered = font.render(line, True, WHITE)
-            screen.blit(rendered, (box_rect.x + 20, box_rect.y + 20 + i * 35))
-
-        # Draw instruction text
-        instruction_font = pygame.font.Font(FONT_PATH, 24)
-        instruction = instruction_font.render("Press any key to continue...", True, WHITE)
-        instruction_rect = instruction.get_rect(center=(box_rect.centerx, box_rect.bottom - 25))
-        screen.blit(instruction, instruction_rect)
-        
-        pygame.display.update()
+    """Display a trivia modal over the current frame and block until the player dismisses it"""
+    modal = Modal(trivia_text, font=get_font(FONT_PATH, 32), text_color=WHITE, box_color=(40, 40, 40),
+                  border_color=WHITE, line_height=35, footer="Press any key to continue...",
+                  footer_font=get_font(FONT_PATH, 24))
+    if not modal.wait(screen):
+        pygame.quit()
+        sys.exit()
+    # Don't count the time spent paused as one long frame
+    clock.tick()
 
 def render_text_with_outline(font, text, text_color, outline_color, outline_width=2):
-    """Render text with an outline for better visibility"""
-    # Render the outline first
-    outline_surfaces = []
-    for dx in range(-outline_width, outline_width + 1):
-        for dy in range(-outline_width, outline_width + 1):
-            if dx != 0 or dy != 0:
-                outline_surface = font.render(text, True, outline_color)
-                outline_surfaces.append((outline_surface, dx, dy))
-    
-    # Render the main text
-    text_surface = font.render(text, True, text_color)
-    
-    # Calculate total size needed
-    width = text_surface.get_width() + 2 * outline_width
-    height = text_surface.get_height() + 2 * outline_width
-    
-    # Create final surface
-    final_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-    
-    # Blit outline
-    for outline_surface, dx, dy in outline_surfaces:
-        final_surface.blit(outline_surface, (outline_width + dx, outline_width + dy))
-    
-    # Blit main text
-    final_surface.blit(text_surface, (outline_width, outline_width))
-    
-    return final_surface
-
-def wrap_text(text, font, max_width):
-    """Wrap text to fit within max_width"""
-    words = text.split()
-    lines = []
-    current_line = ""
-    for word in words:
-        test_line = current_line + " " + word if current_line else word
-        if font.size(test_line)[0] <= max_width:
-            current_line = test_line
-        else:
-            lines.append(current_line)
-            current_line = word
-    if current_line:
-        lines.append(current_line)
-    return lines
-
-def show_splash_screen(screen, clock):
+    """Render text with an outline for better visibility (served from the shared text cache)"""
+    return text_cache.render(font, text, text_color, outline_color, outline_width)
+
+def draw_loading_bar(screen, loader):
+    """Thin progress bar along the bottom edge while assets are loading"""
+    done, total = loader.progress()
+    if not total or done >= total:
+        return
+    bar = pygame.Rect(0, SCREEN_HEIGHT - 6, SCREEN_WIDTH, 6)
+    pygame.draw.rect(screen, (40, 40, 40), bar)
+    bar.width = SCREEN_WIDTH * done // total
+    pygame.draw.rect(screen, WHITE, bar)
+
+def show_splash_screen(screen, clock, on_frame=None, loader=None):
     """Display the splash screen and wait for user input to continue"""
-    # Load and scale the splash screen image
-    splash_img = pygame.image.load("assets/START SCREEN.png").convert()
-    splash_img = pygame.transform.scale(splash_img, (SCREEN_WIDTH, SCREEN_HEIGHT))
+    # Load the splash screen image (scaled by the background cache)
+    splash_img = registry.get(SPLASH_IMG_PATH, alpha=False)
     
-    # Display splash screen
+    # Display splash screen (idle: low tick rate, redrawn only when events arrive
+    # or the loading progress changes)
     waiting = True
+    redraw = True
+    progress = None
     while waiting:
-        clock.tick(FPS)
-        for event in pygame.event.get():
+        clock.tick(IDLE_FPS)
+        events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
                 waiting = False
+        if on_frame:
+            on_frame()
+        if loader and loader.progress() != progress:
+            progress = loader.progress()
+            redraw = True
+        if not (redraw or events):
+            continue
+        redraw = False
         
         # Draw splash screen
-        screen.blit(splash_img, (0, 0))
+        splash_background.draw(screen, splash_img)
         
         # Add "Click anywhere to start" text (updated per designer feedback)
-        font = pygame.font.Font(FONT_PATH, 36)
+        font = get_font(FONT_PATH, 36)
         text = render_text_with_outline(font, 'Click anywhere to start!', WHITE, BLACK)
         text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
         screen.blit(text, text_rect)
+        if loader:
+            draw_loading_bar(screen, loader)
         
         pygame.display.update()
 
-def show_instructions_screen(screen, clock):
+def show_instructions_screen(screen, clock, on_frame=None):
     """Display the instructions screen and wait for user input to continue"""
+    # Idle: low tick rate, redrawn only when events arrive
     waiting = True
+    redraw = True
     while waiting:
-        clock.tick(FPS)
-        for event in pygame.event.get():
+        clock.tick(IDLE_FPS)
+        events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
                 waiting = False
+        if on_frame:
+            on_frame()
+        if not (redraw or events):
+            continue
+        redraw = False
         
         # Fill screen with dark background
         screen.fill((20, 20, 40))  # Dark blue background
         
         # Title
-        title_font = pygame.font.Font(FONT_PATH, 48)
+        title_font = get_font(FONT_PATH, 48)
         title_text = render_text_with_outline(title_font, 'HOW TO PLAY', WHITE, BLACK)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
         screen.blit(title_text, title_rect)
@@ -433,8 +266,8 @@ def show_instructions_screen(screen, clock):
         ]
         
         # Draw instructions
-        font = pygame.font.Font(FONT_PATH, 32)
-        small_font = pygame.font.Font(FONT_PATH, 28)
+        font = get_font(FONT_PATH, 32)
+        small_font = get_font(FONT_PATH, 28)
         
         y_start = 180
         line_height = 40
@@ -461,36 +294,190 @@ def show_instructions_screen(screen, clock):
         
         pygame.display.update()
 
-def draw_window(screen, bird, pipes, score, hit_count=0):
-    # Draw galaxy background maintaining aspect ratio to prevent distortion
-    bg_width, bg_height = background_img.get_size()
-    scale_x = SCREEN_WIDTH / bg_width
-    scale_y = SCREEN_HEIGHT / bg_height
-    scale = min(scale_x, scale_y)  # Use smaller scale to maintain aspect ratio
-    
-    new_width = int(bg_width * scale)
-    new_height = int(bg_height * scale)
-    scaled_bg = pygame.transform.smoothscale(background_img, (new_width, new_height))
-    
-    # Center the background if it doesn't fill the entire screen
-    x_offset = (SCREEN_WIDTH - new_width) // 2
-    y_offset = (SCREEN_HEIGHT - new_height) // 2
-    screen.fill(BLACK)  # Fill with black in case background doesn't cover entire screen
-    screen.blit(scaled_bg, (x_offset, y_offset))
+hud_labels = None
+# (surface, position) pairs for the frame's obstacles, reused every frame
+obstacle_blits = []
+
+def get_hud_labels():
+    """Score and hit labels, re-rendered only when their values change"""
+    global hud_labels
+    if hud_labels is None:
+        font = get_font(FONT_PATH, 36)
+        hud_labels = (
+            CachedLabel(font, 'Score: {}', WHITE, BLACK, cache=text_cache),
+            CachedLabel(font, 'Hits: {}/10', WHITE, BLACK, cache=text_cache),
+        )
+    return hud_labels
+
+def draw_window(screen, bird, pipes, score, hit_count=0, alpha=1.0, scroll=0.0, present=True):
+    """
+    Draw one frame; alpha interpolates sprite positions between the last two physics steps
+    scroll is the distance the obstacles have moved, which drives the parallax layers.
+    With present=False the caller pushes the frame with renderer.present() itself.
+    """
+    if parallax_background:
+        # The whole background moves every frame, so the renderer pushes the full window
+        parallax_background.draw(screen, scroll)
+        renderer.begin_frame(screen, None)
+    else:
+        # Draw galaxy background maintaining aspect ratio to prevent distortion
+        # (scaled, centered and letterboxed once by the cache, rebuilt on resize)
+        renderer.begin_frame(screen, gameplay_background.get(background_img, screen.get_size()))
     # Pass game_over state to bird.draw
     crashed = globals().get('game_over', False)
-    bird.draw(screen, crashed=crashed)
+    renderer.add_dirty(bird.draw(screen, crashed=crashed, alpha=alpha))
+    # All obstacle sprites go to the screen in a single Surface.blits call
+    obstacle_blits.clear()
     for pipe in pipes:
-        pipe.draw(screen)
-    font = pygame.font.Font(FONT_PATH, 36)
-    score_text = render_text_with_outline(font, f'Score: {score}', WHITE, BLACK)
-    screen.blit(score_text, (10, 10))
+        pipe.add_blits(obstacle_blits, alpha)
+        for rect in pipe.dirty_rects(alpha):
+            renderer.add_dirty(rect)
+    screen.blits(obstacle_blits, doreturn=False)
+    score_label, hit_label = get_hud_labels()
+    score_text = score_label.render(score)
+    renderer.add_dirty(screen.blit(score_text, (10, 10)))
     
     # Display hit count
-    hit_text = render_text_with_outline(font, f'Hits: {hit_count}/10', WHITE, BLACK)
-    screen.blit(hit_text, (10, 50))
+    hit_text = hit_label.render(hit_count)
+    renderer.add_dirty(screen.blit(hit_text, (10, 50)))
+
+    # Performance HUD (F3 / DARK_SKIES_PROFILE)
+    hud_rect = perf_hud.draw(screen)
+    if hud_rect:
+        renderer.add_dirty(hud_rect)
     
-    pygame.display.update()
+    if present:
+        renderer.present()
+
+def build_parallax_background(size):
+    """
+    Parallax layers for PARALLAX_LAYERS, each scaled once to the screen height
+    Returns None (keeping the static background) if no layer could be read
+    """
+    speeds = dict(PARALLAX_LAYERS)
+    layers = [ParallaxLayer(registry.get(path, image_size, alpha), speeds[path], size)
+              for path, image_size, alpha in parallax_images(size[1])]
+    return ParallaxBackground(layers) if layers else None
+
+def toggle_renderer():
+    """Switch between full redraw and dirty-rect rendering"""
+    global renderer
+    renderer = create_renderer("full" if renderer.mode == "dirty" else "dirty")
+    print(f"Renderer: {renderer.mode}")
+
+# Game over overlays keyed by (screen size, max hits reached)
+game_over_overlays = {}
+
+def build_game_over_overlay(size, max_hits_reached):
+    """Compose the game over image and restart hint into one surface, returned with its position"""
+    screen_width, screen_height = size
+    try:
+        # Scale the game over overlay to fit the screen appropriately
+        overlay_width = screen_width - 100  # Leave some margin
+        scaled_overlay = registry.get_scaled_to_width(GAME_OVER_IMG_PATH, overlay_width)
+    except (pygame.error, OSError) as e:
+        # Fallback to text-based game over if image fails to load
+        print(f"Error loading game over image: {e}")
+        font_large = get_font(FONT_PATH, 48)
+        if max_hits_reached:
+            over_text = render_text_with_outline(font_large, '10 Hits Reached! Press R to Restart', WHITE, BLACK)
+        else:
+            over_text = render_text_with_outline(font_large, 'Game Over! Press R to Restart', WHITE, BLACK)
+        return over_text, (20, screen_height // 2 - 24)
+
+    overlay_height = scaled_overlay.get_height()
+    # Center the overlay on screen
+    image_rect = scaled_overlay.get_rect(topleft=((screen_width - overlay_width) // 2,
+                                                  (screen_height - overlay_height) // 2))
+    # Add restart instruction below the overlay
+    font = get_font(FONT_PATH, 36)
+    restart_text = render_text_with_outline(font, 'Press R to Restart', WHITE, BLACK)
+    restart_rect = restart_text.get_rect(center=(screen_width // 2, image_rect.bottom + 50))
+
+    bounds = image_rect.union(restart_rect)
+    overlay = pygame.Surface(bounds.size, pygame.SRCALPHA)
+    overlay.blit(scaled_overlay, image_rect.move(-bounds.x, -bounds.y))
+    overlay.blit(restart_text, restart_rect.move(-bounds.x, -bounds.y))
+    return overlay.convert_alpha(), bounds.topleft
+
+def draw_game_over(screen, hit_count):
+    """Draw the game over overlay, built once per screen size"""
+    key = (screen.get_size(), hit_count >= MAX_HITS)
+    if key not in game_over_overlays:
+        game_over_overlays[key] = build_game_over_overlay(*key)
+    overlay, position = game_over_overlays[key]
+    renderer.add_dirty(screen.blit(overlay, position))
+
+def run_session(screen, clock, state, ld_client, sounds, trivia_store):
+    """
+    Play one game until the window is closed or the player restarts
+    Returns True if the player pressed R to restart, False to quit
+    Physics advances in fixed steps of 1/PHYSICS_HZ s, however fast frames are drawn;
+    leftover time carries over in an accumulator and is used to interpolate the frame.
+    """
+    global game_over
+    game_over = state.game_over
+    step_time = 1.0 / PHYSICS_HZ
+    step_dt = TICK_RATE / PHYSICS_HZ
+    accumulator = 0.0
+    inputs = []
+    clock.tick()
+
+    while True:
+        # The game over screen idles at a low tick rate until input arrives
+        elapsed = clock.tick(IDLE_FPS if game_over else FPS) / 1000
+        profiler.begin_frame()
+        # After a stall, catch up at most MAX_FRAME_TIME instead of fast-forwarding
+        accumulator += min(elapsed, MAX_FRAME_TIME)
+        with profiler.section("events"):
+            events = pygame.event.get()
+        for event in events:
+            if event.type == pygame.QUIT:
+                return False
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE and not game_over:
+                    # Applied by the next physics step
+                    inputs.append(JUMP)
+                if event.key == pygame.K_r and game_over:
+                    return True
+                if event.key == pygame.K_F2:
+                    toggle_renderer()
+                if event.key == pygame.K_F3:
+                    perf_hud.toggle()
+                    renderer.invalidate()
+                if event.key == pygame.K_m:
+                    # Toggle music mute/unmute
+                    if pygame.mixer.music.get_busy():
+                        pygame.mixer.music.pause()
+                    else:
+                        pygame.mixer.music.unpause()
+
+        with profiler.section("flags"):
+            apply_flag_updates(ld_client, sounds, state, trivia_store)
+        while accumulator >= step_time and not state.game_over:
+            accumulator -= step_time
+            for name, payload in state.step(inputs, step_dt):
+                if name == EVENT_TRIVIA:
+                    # Show trivia modal; the time spent paused doesn't count
+                    show_trivia_modal(screen, clock, payload['text'])
+                    renderer.invalidate()
+                    accumulator = 0.0
+                else:
+                    # the other event names match the sound effect names
+                    play_sound(sounds, name)
+            inputs.clear()
+        if game_over and not events:
+            # Nothing changes on the game over screen without input
+            continue
+        game_over = state.game_over
+        alpha = 1.0 if game_over else accumulator / step_time
+        with profiler.section("draw_window"):
+            draw_window(screen, state.bird, state.pipes, state.score, state.hit_count, alpha,
+                        state.scroll_at(alpha), present=False)
+            if game_over:
+                draw_game_over(screen, state.hit_count)
+        with profiler.section("display.update"):
+            renderer.present()
 
 def main():
     pygame.init()
@@ -498,145 +485,58 @@ def main():
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption('Dark Skies')
     clock = pygame.time.Clock()
+    configure_profiler()
+    # Gameplay assets decode on worker threads while the menus are up
+    loader = start_asset_loader()
     
-    # initializing LD client
+    # initializing LD client (connects in the background, flags use defaults until ready)
     ld_client = LaunchDarklyClient()
     
-    # set global mute state from LD flag
-    global is_muted
-    is_muted = ld_client and ld_client.should_mute_sound()
-    
-    # Load sounds and music
+    # Sounds decode lazily; apply the LD mute flag before any music is loaded
     sounds = load_sounds()
+    apply_sound_flags(ld_client, sounds)
+    load_background_music()
     
-    # LD flag to control initial sound volume
-    if is_muted:
-        set_sound_volume(sounds, 0.0)  # muted
-        print("Sound muted by LaunchDarkly flag")
-        # Also mute background music
-        load_background_music()
-        pygame.mixer.music.set_volume(0.0)
-    else:
-        set_sound_volume(sounds, 0.7)  # at normal volume
-        print("Sound enabled")
-        load_background_music()
-    
-    # Show splash screen first
-    show_splash_screen(screen, clock)
+    # Show splash screen first, applying LD flags as soon as they arrive
+    on_frame = lambda: apply_flag_updates(ld_client, sounds)
+    show_splash_screen(screen, clock, on_frame, loader)
     
     # Show instructions screen
-    show_instructions_screen(screen, clock)
+    show_instructions_screen(screen, clock, on_frame)
     
-    # Load background image and trivia data
-    global background_img
-    background_img = pygame.image.load(BKG_IMG_PATH).convert()
-    trivia_data = load_trivia()
+    # Readiness barrier: wait for the loader (usually done by now), then convert the
+    # decoded images for the display here on the main thread
+    assets = loader.wait()
+    registry.install_prefetched()
+    global background_img, parallax_background
+    background_img = registry.get(BKG_IMG_PATH, BACKGROUND_SIZE, alpha=False)
+    gameplay_background.get(background_img, screen.get_size())
+    if PARALLAX:
+        parallax_background = build_parallax_background(screen.get_size())
+    trivia_store = assets["trivia"]
+    if trivia_store is None:
+        # The background load failed; an empty bank that loaded fine is kept as is
+        trivia_store = load_trivia()
     
     # filter trivia based on LD flags
-    trivia_data = filter_trivia_by_client(trivia_data, ld_client)
+    trivia_data = filter_trivia_by_client(trivia_store, ld_client)
     
-    bird = Bird()
-    # Add more obstacles and make the first appear sooner
-    pipe_spacing = 500  # horizontal distance between pipes
-    num_pipes = max(3, SCREEN_WIDTH // pipe_spacing)
-    pipes = [Pipe(SCREEN_WIDTH // 2 + i * pipe_spacing) for i in range(num_pipes)]
-    # No clouds
-    score = 0
-    hit_count = 0  # Track number of obstacle hits
-    running = True
-    global game_over
-    game_over = False
-
-    while running:
-        clock.tick(FPS)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE and not game_over:
-                    bird.jump()
-                    play_sound(sounds, 'jump')
-                if event.key == pygame.K_r and game_over:
-                    main()
-                    return
-                if event.key == pygame.K_m:
-                    # Toggle music mute/unmute
-                    if pygame.mixer.music.get_busy():
-                        pygame.mixer.music.pause()
-                    else:
-                        pygame.mixer.music.unpause()
-
-        if not game_over:
-            bird.move()
-            remove = []
-            add_pipe = False
-            for pipe in pipes:
-                pipe.move()
-                if pipe.collide(bird) and not hasattr(pipe, 'hit'):
-                    # Mark this pipe as hit to prevent multiple hits
-                    pipe.hit = True
-                    hit_count += 1
-                    play_sound(sounds, 'hit')
-                    
-                    # Check if player has hit 10 obstacles
-                    if hit_count >= 10:
-                        game_over = True
-                        play_sound(sounds, 'game_over')
-
-                if pipe.hit_symbol(bird) and not hasattr(pipe, 'score'):
-                    pipe.score = True
-                    # Show trivia modal
-                    if trivia_data:
-                        trivia_item = random.choice(trivia_data)
-                        show_trivia_modal(screen, clock, trivia_item['text'])
-                        
-                if pipe.x + PIPE_WIDTH < bird.x and not hasattr(pipe, 'scored'):
-                    score += 1
-                    pipe.scored = True
-                    play_sound(sounds, 'score')
-                if pipe.off_screen():
-                    remove.append(pipe)
-            for r in remove:
-                pipes.remove(r)
-                add_pipe = True
-            if add_pipe:
-                pipes.append(Pipe(SCREEN_WIDTH))
-            if bird.y > SCREEN_HEIGHT - bird.height or bird.y < 0:
-                game_over = True
-                play_sound(sounds, 'game_over')
-        draw_window(screen, bird, pipes, score, hit_count)
-        if game_over:
-            # Draw game over overlay using the provided game over screen
-            try:
-                game_over_img = pygame.image.load("assets/Game Over Text.png").convert_alpha()
-                # Scale the game over overlay to fit the screen appropriately
-                overlay_width = SCREEN_WIDTH - 100  # Leave some margin
-                overlay_height = game_over_img.get_height() * (overlay_width / game_over_img.get_width())
-                scaled_overlay = pygame.transform.smoothscale(game_over_img, (int(overlay_width), int(overlay_height)))
-                
-                # Center the overlay on screen
-                overlay_x = (SCREEN_WIDTH - overlay_width) // 2
-                overlay_y = (SCREEN_HEIGHT - overlay_height) // 2
-                screen.blit(scaled_overlay, (overlay_x, overlay_y))
-                
-                # Add restart instruction below the overlay
-                font = pygame.font.Font(FONT_PATH, 36)
-                restart_text = render_text_with_outline(font, 'Press R to Restart', WHITE, BLACK)
-                restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, overlay_y + overlay_height + 50))
-                screen.blit(restart_text, restart_rect)
-            except:
-                # Fallback to text-based game over if image fails to load
-                font = pygame.font.Font(FONT_PATH, 48)
-                if hit_count >= 10:
-                    over_text = render_text_with_outline(font, '10 Hits Reached! Press R to Restart', WHITE, BLACK)
-                else:
-                    over_text = render_text_with_outline(font, 'Game Over! Press R to Restart', WHITE, BLACK)
-                screen.blit(over_text, (20, SCREEN_HEIGHT // 2 - 24))
-            pygame.display.update()
+    # Decode the remaining sound effects in the background before they are needed
+    sounds.preload()
+    
+    # Physics, collisions, scoring and trivia triggers live in the simulation
+    state = GameState(seed=random.randrange(2 ** 32), trivia_data=trivia_data, with_sprites=True)
+
+    # Display, LD client, fonts, sprites and sounds stay loaded across restarts;
+    # pressing R after game over only resets the game state in place
+    while run_session(screen, clock, state, ld_client, sounds, trivia_store):
+        state.reset(seed=random.randrange(2 ** 32))
+        renderer.invalidate()
     
     if ld_client:
         ld_client.close()
     
+    registry.print_report()
     pygame.quit()
     sys.exit()
 
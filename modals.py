@@ -1,16 +1,40 @@
 import pygame
 import time
+from text_cache import text_cache, get_font
+from text_layout import wrap_text
+
+# Events that bring the modal back on screen after the window was covered
+REDRAW_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED)
 
 class Modal:
-    def __init__(self, text, duration=5):
+    """
+    A text box over a dimmed snapshot of the current frame
+    The dimmed box is laid out and rendered once per screen size and composited over
+    the frame captured when the modal appears, so redrawing it never darkens the
+    screen further. wait() blocks on pygame.event.wait until the player dismisses it.
+    """
+
+    def __init__(self, text, duration=5, font=None, text_color=(0, 0, 0), box_color=(255, 255, 255),
+                 border_color=(0, 0, 0), line_height=30, footer=None, footer_font=None):
         self.text = text
         self.duration = duration  # in seconds
         self.start_time = None
         self.active = False
+        self.font = font
+        self.text_color = text_color
+        self.box_color = box_color
+        self.border_color = border_color
+        self.line_height = line_height
+        self.footer = footer
+        self.footer_font = footer_font
+        self._surface = None
+        self._size = None
+        self._frame = None
 
     def show(self):
         self.start_time = time.time()
         self.active = True
+        self._frame = None
 
     def update(self):
         if self.active and (time.time() - self.start_time > self.duration):
@@ -19,36 +43,70 @@ class Modal:
     def draw(self, screen):
         if not self.active:
             return
+        # The frame underneath is captured on the first draw after show()
+        if self._frame is None:
+            self._frame = self.compose(screen)
+        screen.blit(self._frame, (0, 0))
+
+    def compose(self, screen):
+        """Return a copy of the current frame with the modal drawn over it"""
+        frame = screen.copy()
+        frame.blit(self.get_surface(screen.get_size()), (0, 0))
+        return frame
 
+    def wait(self, screen):
+        """
+        Show the modal over the current frame until a key press or click
+        Returns False if the window was closed instead
+        """
+        self.show()
+        frame = self.compose(screen)
+        screen.blit(frame, (0, 0))
+        pygame.display.update()
+        while True:
+            event = pygame.event.wait()
+            if event.type == pygame.QUIT:
+                self.active = False
+                return False
+            if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
+                self.active = False
+                return True
+            if event.type in REDRAW_EVENTS:
+                screen.blit(frame, (0, 0))
+                pygame.display.update()
+
+    def get_surface(self, size):
+        """The dimmed, full-screen modal layer, rebuilt only when the screen size changes"""
+        size = tuple(size)
+        if self._surface is None or size != self._size:
+            self._surface = self._render(size)
+            self._size = size
+        return self._surface
+
+    def _render(self, size):
+        screen_width, screen_height = size
         # Dim the background
-        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # semi-transparent black
-        screen.blit(overlay, (0, 0))
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 180))  # semi-transparent black
 
         # Render modal text box
-        font = pygame.font.SysFont(None, 32)
-        wrapped = self.wrap_text(self.text, font, screen.get_width() - 80)
-        box_height = 40 + len(wrapped) * 30
-        box_rect = pygame.Rect(40, screen.get_height() // 2 - box_height // 2, screen.get_width() - 80, box_height)
-        pygame.draw.rect(screen, (255, 255, 255), box_rect, border_radius=10)
-        pygame.draw.rect(screen, (0, 0, 0), box_rect, 2, border_radius=10)
+        font = self.font or get_font(None, 32)
+        wrapped = wrap_text(self.text, font, screen_width - 80)
+        footer_space = 40 if self.footer else 0  # Extra space for the footer text
+        box_height = 40 + footer_space + len(wrapped) * self.line_height
+        box_rect = pygame.Rect(40, screen_height // 2 - box_height // 2, screen_width - 80, box_height)
+        pygame.draw.rect(surface, self.box_color, box_rect, border_radius=10)
+        pygame.draw.rect(surface, self.border_color, box_rect, 2, border_radius=10)
 
         # Draw each line of wrapped text
         for i, line in enumerate(wrapped):
-            rendered = font.render(line, True, (0, 0, 0))
-            screen.blit(rendered, (box_rect.x + 20, box_rect.y + 20 + i * 30))
-
-    def wrap_text(self, text, font, max_width):
-        words = text.split()
-        lines = []
-        current_line = ""
-        for word in words:
-            test_line = current_line + " " + word if current_line else word
-            if font.size(test_line)[0] <= max_width:
-                current_line = test_line
-            else:
-                lines.append(current_line)
-                current_line = word
-        if current_line:
-            lines.append(current_line)
-        return lines
+            rendered = text_cache.render(font, line, self.text_color, outline_width=0)
+            surface.blit(rendered, (box_rect.x + 20, box_rect.y + 20 + i * self.line_height))
+
+        if self.footer:
+            footer_font = self.footer_font or get_font(None, 24)
+            footer = text_cache.render(footer_font, self.footer, self.text_color, outline_width=0)
+            surface.blit(footer, footer.get_rect(center=(box_rect.centerx, box_rect.bottom - 25)))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
@@ -1,34 +1,223 @@
+import os
 import pygame
 import random
-from constants import SCREEN_HEIGHT, PIPE_WIDTH, PIPE_GAP
+from array import array
+from bisect import bisect_left
+from atlas import sprite_atlas
+from collision import sprites_overlap
+from constants import SCREEN_HEIGHT, PIPE_WIDTH, PIPE_GAP, PIPE_SPEED, ASTEROID_LARGE_SIZE, ASTEROID_SMALL_SIZE, ERROR_SIZE
+
+# Pre-render each pipe's asteroids into one surface when it is laid out (DARK_SKIES_COMPOSITE_PIPES=1)
+COMPOSITE_COLUMNS = os.getenv("DARK_SKIES_COMPOSITE_PIPES", "0") == "1"
+# Largest horizontal offset of an asteroid from the pipe x
+COLUMN_MARGIN = 10
+# Horizontal extent of a pipe's sprites relative to its x, for the collision broad phase
+PIPE_EXTENT = (-COLUMN_MARGIN, ASTEROID_LARGE_SIZE + COLUMN_MARGIN)
 
 class Pipe:
-    def __init__(self, x):
+    """
+    One obstacle column: asteroids above and below a gap with an error symbol in the middle
+    Asteroid offsets are kept in flat arrays relative to the pipe, so moving the pipe
+    only updates its x. Instances are recycled by PipePool through reset().
+    """
+
+    __slots__ = ('rng', 'x', 'prev_x', 'height', 'top_rect', 'bottom_rect', 'gap_rect',
+                 'atlas', 'area_large', 'area_small', 'area_error', 'mask_large', 'mask_small',
+                 'asteroid_dx', 'asteroid_y', 'asteroid_size', 'top_count', 'column_bounds',
+                 'error_dx', 'error_y', 'composite', 'composite_areas', 'hit', 'symbol_hit', 'scored')
+
+    def __init__(self, x, rng=None, with_sprites=True, composite=None):
+        self.top_rect = pygame.Rect(0, 0, PIPE_WIDTH, 0)
+        self.bottom_rect = pygame.Rect(0, 0, PIPE_WIDTH, 0)
+        self.gap_rect = pygame.Rect(0, 0, PIPE_WIDTH, PIPE_GAP)
+        # Asteroid i sits at (x + asteroid_dx[i], asteroid_y[i]); the first top_count are the top column
+        self.asteroid_dx = array('b')
+        self.asteroid_y = array('h')
+        self.asteroid_size = array('B')
+        self.top_count = 0
+        self.column_bounds = []
+        self.atlas = None
+        self.area_large = None
+        self.area_small = None
+        self.area_error = None
+        # Per-asteroid collision masks; headless pipes collide on the asteroid rects instead
+        self.mask_large = None
+        self.mask_small = None
+        # Headless simulations skip image loading entirely
+        if with_sprites:
+            # Asteroids and the error symbol are drawn from the sprite atlas shared by every pipe
+            self.atlas = sprite_atlas.surface
+            self.area_large = sprite_atlas.area("asteroid_large")
+            self.area_small = sprite_atlas.area("asteroid_small")
+            self.area_error = sprite_atlas.area("error")
+            self.mask_large = sprite_atlas.mask("asteroid_large")
+            self.mask_small = sprite_atlas.mask("asteroid_small")
+        # Optional cached rendering of both asteroid columns, allocated once and redrawn on reset
+        self.composite = None
+        self.composite_areas = []
+        if with_sprites and (COMPOSITE_COLUMNS if composite is None else composite):
+            self.composite = pygame.Surface((ASTEROID_LARGE_SIZE + 2 * COLUMN_MARGIN,
+                                             SCREEN_HEIGHT + ASTEROID_LARGE_SIZE), pygame.SRCALPHA)
+            if pygame.display.get_surface() is not None:
+                self.composite = self.composite.convert_alpha()
+        self.reset(x, rng)
+
+    def reset(self, x, rng=None):
+        """Lay the pipe out again at x, reusing its rects and arrays"""
+        # Layout randomness comes from rng so seeded simulations are repeatable
+        self.rng = rng or random
         self.x = x
-        self.height = random.randint(50, SCREEN_HEIGHT - PIPE_GAP - 50)
-        self.top_rect = pygame.Rect(self.x, 0, PIPE_WIDTH, self.height)
-        self.bottom_rect = pygame.Rect(self.x, self.height + PIPE_GAP, PIPE_WIDTH, SCREEN_HEIGHT - self.height - PIPE_GAP)
+        self.prev_x = x
+        self.height = self.rng.randint(50, SCREEN_HEIGHT - PIPE_GAP - 50)
+        self.top_rect.update(self.x, 0, PIPE_WIDTH, self.height)
+        self.bottom_rect.update(self.x, self.height + PIPE_GAP, PIPE_WIDTH, SCREEN_HEIGHT - self.height - PIPE_GAP)
+        self.gap_rect.update(self.x, self.height, PIPE_WIDTH, PIPE_GAP)
+        # Choose asteroids for obstacles
+        del self.asteroid_dx[:], self.asteroid_y[:], self.asteroid_size[:]
+        self._generate_asteroid_pattern(self.top_rect)
+        self.top_count = len(self.asteroid_y)
+        self._generate_asteroid_pattern(self.bottom_rect)
+        # Single error symbol in the middle of the gap
+        self._generate_error_positions()
+        # Bounds of each asteroid column relative to the pipe, for dirty-rect tracking
+        total = len(self.asteroid_y)
+        self.column_bounds = [self._column_bounds(first, last)
+                              for first, last in ((0, self.top_count), (self.top_count, total)) if last > first]
+        if self.composite is not None:
+            self._render_composite()
+        # Per-pass state checked by the game loop
+        self.hit = False
+        self.symbol_hit = False
+        self.scored = False
+
+    def _generate_asteroid_pattern(self, rect):
+        """Generate asteroid positions to fill the obstacle area"""
+        y = rect.y
+        while y < rect.y + rect.height:
+            # Randomly choose asteroid size
+            if self.rng.random() < 0.6:  # 60% chance for large asteroid
+                size = ASTEROID_LARGE_SIZE
+            else:
+                size = ASTEROID_SMALL_SIZE
+            
+            # Add some random horizontal offset for variety
+            self.asteroid_dx.append(self.rng.randint(-10, 10))
+            self.asteroid_y.append(y)
+            self.asteroid_size.append(size)
+            y += size - 10  # Slight overlap for better coverage
 
-    def move(self):
-        self.x -= 3
+    def _column_bounds(self, first, last):
+        """Bounding rect of asteroids first..last-1, with x relative to the pipe"""
+        dx, ys, sizes = self.asteroid_dx, self.asteroid_y, self.asteroid_size
+        rect = pygame.Rect(dx[first], ys[first], sizes[first], sizes[first])
+        rect.unionall_ip([pygame.Rect(dx[i], ys[i], sizes[i], sizes[i]) for i in range(first + 1, last)])
+        return rect
+
+    def _render_composite(self):
+        """Draw every asteroid into the composite surface (x shifted by COLUMN_MARGIN)"""
+        self.composite.fill((0, 0, 0, 0))
+        self.composite.blits([(self.atlas, (dx + COLUMN_MARGIN, y), self._asteroid_area(size))
+                              for dx, y, size in zip(self.asteroid_dx, self.asteroid_y, self.asteroid_size)],
+                             doreturn=False)
+        self.composite_areas = [bounds.move(COLUMN_MARGIN, 0) for bounds in self.column_bounds]
+
+    def _asteroid_area(self, size):
+        return self.area_large if size == ASTEROID_LARGE_SIZE else self.area_small
+
+    def _generate_error_positions(self):
+        """Place the error symbol at the middle of the gap (offset from the pipe x)"""
+        self.error_dx = PIPE_WIDTH // 2
+        self.error_y = self.gap_rect.y + PIPE_GAP // 2
+
+    def move(self, dt=1.0):
+        """Scroll left; dt is the step length in 60 Hz ticks"""
+        self.prev_x = self.x
+        self.x -= PIPE_SPEED * dt
         self.top_rect.x = self.x
         self.bottom_rect.x = self.x
+        self.gap_rect.x = self.x
 
-    def draw(self, screen):
-        for rect in [self.top_rect, self.bottom_rect]:
-            pygame.draw.rect(screen, (220, 220, 220), rect)
-            for i in range(1, 6):
-                x = rect.x + int(i * rect.width / 6)
-                pygame.draw.line(screen, (180, 180, 180), (x, rect.y), (x, rect.y + rect.height), 2)
-            if rect == self.top_rect:
-                cap_rect = pygame.Rect(rect.x - 4, rect.bottom - 8, rect.width + 8, 12)
-                pygame.draw.rect(screen, (200, 200, 200), cap_rect)
-            else:
-                base_rect = pygame.Rect(rect.x - 4, rect.y - 4, rect.width + 8, 12)
-                pygame.draw.rect(screen, (200, 200, 200), base_rect)
+    def draw_x(self, alpha=1.0):
+        """Screen x to draw at, interpolated between the last two steps (alpha 0..1)"""
+        return round(self.prev_x + (self.x - self.prev_x) * alpha)
+
+    def add_blits(self, blits, alpha=1.0):
+        """
+        Append this pipe's (surface, position[, area]) blits to a list for Surface.blits
+        Collecting every pipe's blits lets the caller draw all obstacles in one call
+        """
+        x = self.draw_x(alpha)
+        if self.composite is not None:
+            # One blit per column; the transparent gap between them is skipped
+            for area in self.composite_areas:
+                blits.append((self.composite, (x + area.x - COLUMN_MARGIN, area.y), area))
+        else:
+            # Asteroids in the top and bottom areas
+            atlas, area_large, area_small = self.atlas, self.area_large, self.area_small
+            for dx, y, size in zip(self.asteroid_dx, self.asteroid_y, self.asteroid_size):
+                blits.append((atlas, (x + dx, y), area_large if size == ASTEROID_LARGE_SIZE else area_small))
+        # Single error symbol in the middle of the gap
+        blits.append((self.atlas, (x + self.error_dx, self.error_y), self.area_error))
+        return blits
+
+    def draw(self, screen, alpha=1.0):
+        screen.blits(self.add_blits([], alpha), doreturn=False)
+
+    def dirty_rects(self, alpha=1.0):
+        """Screen regions covered by this pipe's asteroid columns and error symbol"""
+        x = self.draw_x(alpha)
+        rects = [bounds.move(x, 0) for bounds in self.column_bounds]
+        rects.append(pygame.Rect(x + self.error_dx, self.error_y, ERROR_SIZE, ERROR_SIZE))
+        return rects
 
     def off_screen(self):
         return self.x < -PIPE_WIDTH
 
     def collide(self, bird):
-        return self.top_rect.colliderect(bird.rect) or self.bottom_rect.colliderect(bird.rect)
+        """True if the van touches an asteroid within this pipe's top or bottom column"""
+        bird_rect = bird.rect
+        ys = self.asteroid_y
+        # Asteroids are laid out top to bottom, so only a slice of them can reach the van
+        first = bisect_left(ys, bird_rect.top - ASTEROID_LARGE_SIZE + 1)
+        last = bisect_left(ys, bird_rect.bottom, first)
+        for i in range(first, last):
+            size = self.asteroid_size[i]
+            mask = self.mask_large if size == ASTEROID_LARGE_SIZE else self.mask_small
+            rect = pygame.Rect(self.x + self.asteroid_dx[i], ys[i], size, size)
+            # Only the part of an asteroid inside its column counts, so overhangs into the gap are harmless
+            column = self.top_rect if i < self.top_count else self.bottom_rect
+            if sprites_overlap(bird_rect, bird.mask, rect, mask, column):
+                return True
+        return False
+
+    def hit_symbol(self, bird):
+        return self.gap_rect.colliderect(bird.rect)
+
+
+class PipePool:
+    """
+    Fixed set of Pipe instances recycled as obstacles scroll off screen
+    acquire() lays out a free pipe at x; release() hands it back. The pool only
+    allocates a new Pipe if every preallocated one is in use.
+    """
+
+    def __init__(self, size, rng=None, with_sprites=True, composite=None):
+        self.rng = rng
+        self.with_sprites = with_sprites
+        self.composite = composite
+        # Placeholder layouts use their own RNG so building the pool doesn't shift the game's sequence
+        layout_rng = random.Random(0)
+        self._free = [Pipe(0, rng=layout_rng, with_sprites=with_sprites, composite=composite) for _ in range(size)]
+
+    def acquire(self, x):
+        if self._free:
+            pipe = self._free.pop()
+            pipe.reset(x, self.rng)
+            return pipe
+        return Pipe(x, rng=self.rng, with_sprites=self.with_sprites, composite=self.composite)
+
+    def release(self, pipe):
+        self._free.append(pipe)
+
+    def __len__(self):
+        return len(self._free)
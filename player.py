@@ -1,39 +1,56 @@
 import pygame
+from atlas import sprite_atlas
 from constants import SCREEN_HEIGHT, BIRD_WIDTH, BIRD_HEIGHT, GRAVITY, JUMP_STRENGTH
 
 class Bird:
-    def __init__(self):
-        self.x = 50
-        self.y = SCREEN_HEIGHT // 2
+    def __init__(self, with_sprites=True):
         self.width = BIRD_WIDTH
         self.height = BIRD_HEIGHT
+        self.rect = pygame.Rect(0, 0, self.width, self.height)
+        self.reset()
+        self.atlas = None
+        self.area_normal = None
+        self.area_crashed = None
+        # Collision mask of the van sprite (None when headless, which collides on rects)
+        self.mask = None
+        # Headless simulations skip image loading entirely
+        if with_sprites:
+            # Van images at bird size, drawn from the shared sprite atlas
+            self.atlas = sprite_atlas.surface
+            self.area_normal = sprite_atlas.area("van")
+            self.area_crashed = sprite_atlas.area("van_crashed")
+            self.mask = sprite_atlas.mask("van")
+
+    def reset(self):
+        """Put the van back at its starting position (sprites are kept)"""
+        self.x = 50
+        self.y = SCREEN_HEIGHT // 2
+        self.prev_y = self.y
         self.velocity = 0
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.rect.topleft = (self.x, self.y)
         self.wing_up = True
         self.animation_counter = 0
 
     def jump(self):
         self.velocity = JUMP_STRENGTH
 
-    def move(self):
-        self.velocity += GRAVITY
-        self.y += self.velocity
+    def move(self, dt=1.0):
+        """Advance the van by dt, measured in 60 Hz ticks"""
+        self.prev_y = self.y
+        self.velocity += GRAVITY * dt
+        self.y += self.velocity * dt
         self.rect.y = int(self.y)
-        self.animation_counter += 1
-        if self.animation_counter % 7 == 0:
+        # Animate wing
+        self.animation_counter += dt
+        if self.animation_counter >= 7:
+            self.animation_counter -= 7
             self.wing_up = not self.wing_up
 
-    def draw(self, screen):
-        center = (int(self.x + self.width // 2), int(self.y + self.height // 2))
-        pygame.draw.ellipse(screen, (255, 255, 0), self.rect)
-        if self.wing_up:
-            wing_rect = pygame.Rect(self.rect.x + 8, self.rect.y + 6, 14, 8)
+    def draw(self, screen, crashed=False, alpha=1.0):
+        """Draw the van between its last two positions (alpha 0..1); returns the drawn rect"""
+        y = int(self.prev_y + (self.y - self.prev_y) * alpha)
+        # Draw the van image at the bird's position
+        if crashed:
+            return screen.blit(self.atlas, (self.rect.x, y), self.area_crashed)
         else:
-            wing_rect = pygame.Rect(self.rect.x + 8, self.rect.y + 14, 14, 8)
-        pygame.draw.ellipse(screen, (200, 200, 0), wing_rect)
-        beak_tip = (self.rect.right + 6, center[1])
-        beak_base1 = (self.rect.right, center[1] - 4)
-        beak_base2 = (self.rect.right, center[1] + 4)
-        pygame.draw.polygon(screen, (255, 128, 0), [beak_tip, beak_base1, beak_base2])
-        eye_center = (self.rect.x + self.width - 10, self.rect.y + 8)
-        pygame.draw.circle(screen, (0, 0, 0), eye_center, 3)
\ No newline at end of file
+            return screen.blit(self.atlas, (self.rect.x, y), self.area_normal)
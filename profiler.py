@@ -0,0 +1,233 @@
+"""
+Frame profiler, performance HUD and logging hooks
+
+    DARK_SKIES_PROFILE=1             show the HUD from the start (F3 toggles it in game)
+    DARK_SKIES_PROFILE_LOG=perf.log  append one JSON line per frame to a rotating log
+    DARK_SKIES_PROFILE_LOG_MIN_MS=20 only log frames at least this slow
+
+Collection is off (and nearly free) until the HUD is shown or a hook is added.
+"""
+import contextlib
+import json
+import logging
+import os
+import time
+from collections import deque
+from logging.handlers import RotatingFileHandler
+import pygame
+
+# Frame-time histogram buckets (upper bounds in ms; the last bucket is open-ended)
+HISTOGRAM_BUCKETS = (4, 8, 12, 16.7, 20, 25, 33.3, 50, 100)
+_null_section = contextlib.nullcontext()
+
+
+class FrameProfiler:
+    """
+    Collects per-frame section timings and counters, and passes each finished frame to hooks
+    Sections are timed with section(name), or with mark() followed by lap(name) calls in
+    hot paths where a context manager costs too much; counters are bumped with count(name)
+    at the call sites that create surfaces and fonts (the text cache and asset registry).
+    Each frame's record is a dict with frame_ms, sections (ms) and counts. Counters are
+    meant for the main thread; worker threads should not count into the frame.
+    """
+
+    def __init__(self, history=240):
+        self.enabled = False
+        self.frame = 0
+        self.history = deque(maxlen=history)
+        self._hooks = []
+        self._frame_start = None
+        self._sections = {}
+        self._counts = {}
+        self._lap_start = 0.0
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        """Stop collecting, unless hooks still need the measurements"""
+        if not self._hooks:
+            self.enabled = False
+            self._frame_start = None
+
+    def add_hook(self, hook):
+        """Call hook(record) after every frame; enables collection"""
+        self._hooks.append(hook)
+        self.enable()
+
+    def remove_hook(self, hook):
+        self._hooks.remove(hook)
+
+    def section(self, name):
+        """Context manager timing a block of the frame under name (a no-op when disabled)"""
+        if not self.enabled:
+            return _null_section
+        return _Section(self._sections, name)
+
+    def mark(self):
+        """Start a lap; the next lap(name) is timed from here"""
+        if self.enabled:
+            self._lap_start = time.perf_counter()
+
+    def lap(self, name):
+        """Add the time since the last mark() or lap() to section name"""
+        if self.enabled:
+            now = time.perf_counter()
+            self._sections[name] = self._sections.get(name, 0.0) + (now - self._lap_start) * 1000
+            self._lap_start = now
+
+    def count(self, name, amount=1):
+        if self.enabled:
+            self._counts[name] = self._counts.get(name, 0) + amount
+
+    def begin_frame(self):
+        """Finish the previous frame (if any) and start timing a new one"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self._finish((now - self._frame_start) * 1000)
+        self._frame_start = now
+
+    def _finish(self, frame_ms):
+        self.frame += 1
+        record = {
+            "frame": self.frame,
+            "time": time.time(),
+            "frame_ms": round(frame_ms, 3),
+            "sections": {name: round(ms, 3) for name, ms in self._sections.items()},
+            "counts": dict(self._counts),
+        }
+        self._sections.clear()
+        self._counts.clear()
+        self.history.append(record)
+        for hook in self._hooks:
+            hook(record)
+
+
+class _Section:
+    __slots__ = ("sections", "name", "start")
+
+    def __init__(self, sections, name):
+        self.sections = sections
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        elapsed = (time.perf_counter() - self.start) * 1000
+        self.sections[self.name] = self.sections.get(self.name, 0.0) + elapsed
+
+
+def log_to(profiler, path, max_bytes=1_000_000, backup_count=3, min_frame_ms=0.0):
+    """Write frame records as JSON lines to a size-rotated log file; returns the hook"""
+    logger = logging.getLogger("dark_skies.perf")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count))
+
+    def hook(record):
+        if record["frame_ms"] >= min_frame_ms:
+            logger.info(json.dumps(record))
+
+    profiler.add_hook(hook)
+    return hook
+
+
+class PerfHUD:
+    """
+    Corner overlay with FPS, a frame-time histogram, section times and per-frame counts
+    Text is re-rendered a few times per second; the histogram covers the profiler's history.
+    """
+
+    def __init__(self, profiler, refresh_frames=15, width=260):
+        self.profiler = profiler
+        self.refresh_frames = refresh_frames
+        self.width = width
+        self.visible = False
+        self._font = None
+        self._surface = None
+        self._rendered_frame = -refresh_frames
+
+    def toggle(self):
+        self.visible = not self.visible
+        if self.visible:
+            self.profiler.enable()
+        else:
+            self.profiler.disable()
+        self._surface = None
+
+    def draw(self, screen):
+        """Blit the HUD in the top-right corner; returns the rect drawn (None if hidden)"""
+        if not self.visible:
+            return None
+        if self._surface is None or self.profiler.frame - self._rendered_frame >= self.refresh_frames:
+            self._surface = self._render()
+            self._rendered_frame = self.profiler.frame
+        return screen.blit(self._surface, (screen.get_width() - self._surface.get_width() - 10, 10))
+
+    def _render(self):
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+        history = list(self.profiler.history)
+        recent = history[-self.refresh_frames:]
+        # (label, value) rows; values are right-aligned
+        rows = []
+        if not recent:
+            rows.append(("FPS", "--"))
+        else:
+            frame_ms = sorted(record["frame_ms"] for record in recent)
+            mean_ms = sum(frame_ms) / len(frame_ms)
+            rows.append(("FPS", f"{1000 / mean_ms if mean_ms else 0:.1f}"))
+            rows.append(("frame (mean / max)", f"{mean_ms:.2f} / {frame_ms[-1]:.2f} ms"))
+            names = []
+            for record in recent:
+                names.extend(name for name in record["sections"] if name not in names)
+            for name in names:
+                average = sum(record["sections"].get(name, 0.0) for record in recent) / len(recent)
+                rows.append((name, f"{average:.2f} ms"))
+            for name in ("surfaces", "fonts"):
+                average = sum(record["counts"].get(name, 0) for record in recent) / len(recent)
+                rows.append((f"{name} / frame", f"{average:.1f}"))
+
+        line_height = 18
+        histogram_height = 40
+        surface = pygame.Surface((self.width, 12 + len(rows) * line_height + histogram_height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 170))
+        for i, (label, value) in enumerate(rows):
+            y = 6 + i * line_height
+            surface.blit(self._font.render(label, True, (255, 255, 255)), (6, y))
+            value_text = self._font.render(value, True, (255, 255, 255))
+            surface.blit(value_text, (self.width - 6 - value_text.get_width(), y))
+
+        # Histogram of frame times over the whole history
+        counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        for record in history:
+            bucket = 0
+            while bucket < len(HISTOGRAM_BUCKETS) and record["frame_ms"] > HISTOGRAM_BUCKETS[bucket]:
+                bucket += 1
+            counts[bucket] += 1
+        peak = max(counts) or 1
+        bar_width = (self.width - 12) // len(counts)
+        bottom = surface.get_height() - 6
+        for i, count in enumerate(counts):
+            height = int((histogram_height - 8) * count / peak)
+            # Buckets past one 60 FPS frame (16.7 ms) are drawn in red
+            color = (0, 200, 0) if i < 4 else (220, 60, 60)
+            pygame.draw.rect(surface, color, (6 + i * bar_width, bottom - height, bar_width - 2, height))
+        return surface
+
+
+# shared profiler used by the game loop and the simulation
+profiler = FrameProfiler()
+perf_hud = PerfHUD(profiler)
+
+
+def configure_from_env():
+    """Apply DARK_SKIES_PROFILE and DARK_SKIES_PROFILE_LOG"""
+    if os.getenv("DARK_SKIES_PROFILE", "0") == "1" and not perf_hud.visible:
+        perf_hud.toggle()
+    log_path = os.getenv("DARK_SKIES_PROFILE_LOG")
+    if log_path:
+        log_to(profiler, log_path, min_frame_ms=float(os.getenv("DARK_SKIES_PROFILE_LOG_MIN_MS", "0")))
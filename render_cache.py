@@ -0,0 +1,117 @@
+import pygame
+
+
+def fitted_size(source_size, size):
+    """Largest size with the aspect ratio of source_size that fits inside size"""
+    (src_width, src_height), (width, height) = source_size, size
+    scale = min(width / src_width, height / src_height)
+    return int(src_width * scale), int(src_height * scale)
+
+
+class BackgroundCache:
+    """
+    Keeps a background image pre-scaled to the current screen size
+    The scaled surface is rebuilt only when the source image or the screen size changes
+    """
+
+    def __init__(self, preserve_aspect=True, smooth=True, fill_color=(0, 0, 0)):
+        self.preserve_aspect = preserve_aspect
+        self.smooth = smooth
+        self.fill_color = fill_color
+        self._source = None
+        self._size = None
+        self._surface = None
+
+    def get(self, source, size):
+        """Return the background scaled for a screen of the given size"""
+        size = tuple(size)
+        if self._surface is None or source is not self._source or size != self._size:
+            self._surface = self._build(source, size)
+            self._source = source
+            self._size = size
+        return self._surface
+
+    def draw(self, screen, source):
+        """Blit the cached background over the whole screen"""
+        screen.blit(self.get(source, screen.get_size()), (0, 0))
+
+    def invalidate(self):
+        """Drop the cached surface so the next draw rebuilds it"""
+        self._source = None
+        self._size = None
+        self._surface = None
+
+    def _build(self, source, size):
+        screen_width, screen_height = size
+        if self.preserve_aspect:
+            new_width, new_height = fitted_size(source.get_size(), size)
+        else:
+            new_width, new_height = screen_width, screen_height
+
+        if self.smooth:
+            scaled = pygame.transform.smoothscale(source, (new_width, new_height))
+        else:
+            scaled = pygame.transform.scale(source, (new_width, new_height))
+
+        # Compose onto a full-screen surface so drawing is a single opaque blit
+        surface = pygame.Surface(size)
+        surface.fill(self.fill_color)
+        surface.blit(scaled, ((screen_width - new_width) // 2, (screen_height - new_height) // 2))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+
+
+class ParallaxLayer:
+    """
+    A horizontally wrapping background layer scrolled at speed times the obstacle speed
+    The image is scaled to the screen height once (by whoever passes it in) and, if
+    narrower than the screen, repeated until it is at least a screen wide. Any scroll
+    offset is then drawn with two blits: the strip from the offset to the right edge,
+    and the strip wrapped around from the left edge, so the cost does not grow with
+    the tile width.
+    """
+
+    def __init__(self, image, speed, screen_size):
+        self.speed = speed
+        screen_width = screen_size[0]
+        tile_width, height = image.get_size()
+        if tile_width < screen_width:
+            repeats = -(-screen_width // tile_width)
+            surface = pygame.Surface((tile_width * repeats, height))
+            surface.blits([(image, (i * tile_width, 0)) for i in range(repeats)], doreturn=False)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            image = surface
+        self.image = image
+        self.width = image.get_width()
+        self.screen_width = screen_width
+        self._left = pygame.Rect(0, 0, 0, height)
+        self._right = pygame.Rect(0, 0, 0, height)
+
+    @staticmethod
+    def scaled_size(source_size, height):
+        """Size of an image of source_size scaled to height, keeping its aspect ratio"""
+        src_width, src_height = source_size
+        return int(src_width * height / src_height), height
+
+    def draw(self, screen, distance):
+        """Blit the layer scrolled left by distance * speed pixels"""
+        offset = int(distance * self.speed) % self.width
+        visible = min(self.width - offset, self.screen_width)
+        self._left.update(offset, 0, visible, self._left.height)
+        screen.blit(self.image, (0, 0), self._left)
+        if visible < self.screen_width:
+            self._right.width = self.screen_width - visible
+            screen.blit(self.image, (visible, 0), self._right)
+
+
+class ParallaxBackground:
+    """Parallax layers drawn back to front; the first layer should be opaque"""
+
+    def __init__(self, layers):
+        self.layers = layers
+
+    def draw(self, screen, distance):
+        for layer in self.layers:
+            layer.draw(screen, distance)
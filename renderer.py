@@ -0,0 +1,86 @@
+import os
+import pygame
+
+RENDERER_MODES = ("full", "dirty")
+
+
+class FullRenderer:
+    """Redraws the whole background and pushes the entire window every frame"""
+
+    mode = "full"
+
+    def begin_frame(self, screen, background):
+        # None: the caller already drew the whole background
+        if background is not None:
+            screen.blit(background, (0, 0))
+
+    def add_dirty(self, rect):
+        pass
+
+    def present(self):
+        pygame.display.update()
+
+    def invalidate(self):
+        pass
+
+
+class DirtyRectRenderer:
+    """
+    Restores and updates only the screen regions that changed since the last frame
+    Every frame the regions drawn in the previous frame are restored from the cached
+    background, then both the old and new regions are passed to display.update.
+    A frame begun without a background (one the caller redrew entirely, such as a
+    scrolling background) is pushed in full.
+    """
+
+    mode = "dirty"
+
+    def __init__(self):
+        self._background = None
+        self._screen_rect = None
+        self._previous = []
+        self._current = []
+        self._full_redraw = True
+
+    def begin_frame(self, screen, background):
+        self._screen_rect = screen.get_rect()
+        if background is None:
+            self._full_redraw = True
+        elif self._full_redraw or background is not self._background:
+            screen.blit(background, (0, 0))
+            self._full_redraw = True
+        else:
+            for rect in self._previous:
+                screen.blit(background, rect, rect)
+        self._background = background
+
+    def add_dirty(self, rect):
+        """Mark a region drawn this frame (clipped to the screen)"""
+        rect = pygame.Rect(rect)
+        if self._screen_rect is not None:
+            rect = rect.clip(self._screen_rect)
+        if rect.width and rect.height:
+            self._current.append(rect)
+
+    def present(self):
+        if self._full_redraw:
+            pygame.display.update()
+            self._full_redraw = False
+        else:
+            pygame.display.update(self._previous + self._current)
+        self._previous = self._current
+        self._current = []
+
+    def invalidate(self):
+        """Force a full redraw next frame, e.g. after something drew over the window"""
+        self._full_redraw = True
+
+
+def create_renderer(mode=None):
+    """Create a renderer by mode name, defaulting to DARK_SKIES_RENDERER or 'full'"""
+    mode = (mode or os.getenv("DARK_SKIES_RENDERER", "full")).lower()
+    if mode == "dirty":
+        return DirtyRectRenderer()
+    if mode != "full":
+        print(f"Unknown renderer mode '{mode}', using full redraw")
+    return FullRenderer()
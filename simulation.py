@@ -0,0 +1,178 @@
+import random
+import sys
+import time
+from player import Bird
+from obstacle import PipePool, PIPE_EXTENT
+from collision import SweepAndPrune
+from profiler import profiler
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, PIPE_WIDTH, PIPE_GAP, PIPE_SPACING, PIPE_SPEED, MAX_HITS
+
+# Input actions accepted by GameState.step
+JUMP = "jump"
+
+# Events reported by GameState.step as (name, payload) tuples
+EVENT_JUMP = "jump"
+EVENT_HIT = "hit"
+EVENT_SCORE = "score"
+EVENT_TRIVIA = "trivia"
+EVENT_GAME_OVER = "game_over"
+
+
+class GameState:
+    """
+    All mutable state of one game, advanced one tick at a time by step()
+    Nothing here touches the display or the event queue, so the game can be stepped
+    headless for tests, replays and load generation. All randomness comes from a
+    seeded RNG, so the same seed and inputs always produce the same game.
+    """
+
+    def __init__(self, seed=None, trivia_data=None, with_sprites=False):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        # anything with sample(rng), e.g. a trivia_store.TriviaSelection
+        self.trivia_data = trivia_data
+        self.with_sprites = with_sprites
+        self.bird = Bird(with_sprites=with_sprites)
+        # Add more obstacles and make the first appear sooner
+        self.num_pipes = max(3, SCREEN_WIDTH // PIPE_SPACING)
+        self.pipe_pool = PipePool(self.num_pipes, rng=self.rng, with_sprites=with_sprites)
+        self.pipes = []
+        # Broad phase over self.pipes (the same list, kept sorted by x)
+        self.broadphase = SweepAndPrune(self.pipes, *PIPE_EXTENT)
+        self._start()
+
+    def _start(self):
+        for pipe in self.pipes:
+            self.pipe_pool.release(pipe)
+        self.pipes[:] = [self._new_pipe(SCREEN_WIDTH // 2 + i * PIPE_SPACING) for i in range(self.num_pipes)]
+        self.broadphase.resort()
+        self.score = 0
+        self.hit_count = 0  # Track number of obstacle hits
+        self.game_over = False
+        self.ticks = 0
+        # Distance the obstacles have scrolled, for the parallax background
+        self.scroll = 0.0
+        self.prev_scroll = 0.0
+
+    def reset(self, seed=None):
+        """
+        Start a new game in place, keeping the van, its sprites and the trivia selection
+        Pipes go back to the pool and are laid out again, so restarting allocates nothing
+        """
+        self.seed = seed
+        self.rng.seed(seed)
+        self.bird.reset()
+        self._start()
+
+    def _new_pipe(self, x):
+        return self.pipe_pool.acquire(x)
+
+    def _collide(self, bird, events):
+        # Only pipes overlapping the van horizontally can touch it or its trigger
+        for pipe in self.broadphase.near(bird.rect.left, bird.rect.right):
+            if not pipe.hit and pipe.collide(bird):
+                # Mark this pipe as hit to prevent multiple hits
+                pipe.hit = True
+                self.hit_count += 1
+                events.append((EVENT_HIT, None))
+
+                # Check if player has hit 10 obstacles
+                if self.hit_count >= MAX_HITS:
+                    self.game_over = True
+                    events.append((EVENT_GAME_OVER, None))
+
+            if not pipe.symbol_hit and pipe.hit_symbol(bird):
+                pipe.symbol_hit = True
+                # Trigger a trivia modal
+                if self.trivia_data:
+                    events.append((EVENT_TRIVIA, self.trivia_data.sample(self.rng)))
+
+    def step(self, inputs=(), dt=1.0):
+        """
+        Advance the game by one tick
+        inputs: iterable of actions for this tick (JUMP)
+        dt: tick length in 60 Hz ticks (0.5 when stepping at 120 Hz)
+        Returns the list of (event, payload) tuples that happened during the tick
+        """
+        events = []
+        if self.game_over:
+            return events
+
+        if JUMP in inputs:
+            self.bird.jump()
+            events.append((EVENT_JUMP, None))
+
+        bird = self.bird
+        profiler.mark()
+        bird.move(dt)
+        for pipe in self.pipes:
+            pipe.move(dt)
+        self.prev_scroll = self.scroll
+        self.scroll += PIPE_SPEED * dt
+        profiler.lap("move")
+
+        self._collide(bird, events)
+        profiler.lap("collision")
+
+        # Pipes pass the van in x order, so only the nearest ones behind it can still be unscored
+        passed = self.broadphase.left_of(bird.x - PIPE_WIDTH)
+        for pipe in reversed(self.pipes[:passed]):
+            if pipe.scored:
+                break
+            self.score += 1
+            pipe.scored = True
+            events.append((EVENT_SCORE, None))
+
+        # Off-screen pipes are at the front of the sorted list
+        removed = 0
+        while self.pipes and self.pipes[0].off_screen():
+            self.pipe_pool.release(self.pipes.pop(0))
+            removed += 1
+        if removed:
+            self.broadphase.add(self._new_pipe(SCREEN_WIDTH))
+        if not self.game_over and (bird.y > SCREEN_HEIGHT - bird.height or bird.y < 0):
+            self.game_over = True
+            events.append((EVENT_GAME_OVER, None))
+
+        self.ticks += 1
+        return events
+
+    def scroll_at(self, alpha=1.0):
+        """Scroll distance between the last two steps (alpha 0..1), like the drawn obstacles"""
+        return self.prev_scroll + (self.scroll - self.prev_scroll) * alpha
+
+
+def autopilot(state):
+    """Simple scripted input: jump whenever the van drops below the next gap's center"""
+    bird = state.bird
+    upcoming = [pipe for pipe in state.pipes if pipe.x + PIPE_WIDTH >= bird.x]
+    if not upcoming:
+        return ()
+    target = min(upcoming, key=lambda pipe: pipe.x)
+    gap_center = target.height + PIPE_GAP / 2
+    if bird.y + bird.height / 2 > gap_center and bird.velocity >= 0:
+        return (JUMP,)
+    return ()
+
+
+def run_headless(ticks, seed=0, policy=autopilot, trivia_data=None):
+    """Step a fresh game for the given number of ticks, restarting whenever it ends"""
+    state = GameState(seed=seed, trivia_data=trivia_data)
+    games = 1
+    for _ in range(ticks):
+        if state.game_over:
+            state.reset(seed=state.rng.random())
+            games += 1
+        state.step(policy(state))
+    return state, games
+
+
+if __name__ == '__main__':
+    # Quick throughput check: python simulation.py [ticks] [seed]
+    total_ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    run_seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    start = time.perf_counter()
+    final_state, game_count = run_headless(total_ticks, seed=run_seed)
+    elapsed = time.perf_counter() - start
+    print(f"{total_ticks} ticks in {elapsed:.2f}s ({total_ticks / elapsed:.0f} ticks/s), "
+          f"{game_count} games, last score {final_state.score}")
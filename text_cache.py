@@ -0,0 +1,118 @@
+import os
+from collections import OrderedDict
+import pygame
+from profiler import profiler
+
+# Fonts are parsed from the TTF once per (path, size)
+_fonts = {}
+
+
+def get_font(path, size):
+    """Return a shared pygame Font for (path, size), loading it on first use"""
+    key = (path, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(path, size)
+        _fonts[key] = font
+        profiler.count("fonts")
+    return font
+
+
+def render_outlined_text(font, text, text_color, outline_color, outline_width=2):
+    """Render text with an outline for better visibility (uncached)"""
+    text_surface = font.render(text, True, text_color)
+    if outline_width <= 0 or outline_color is None:
+        profiler.count("surfaces")
+        return text_surface
+    # Text, outline and the combined surface
+    profiler.count("surfaces", 3)
+
+    # The outline glyphs are identical at every offset, so render them once
+    outline_surface = font.render(text, True, outline_color)
+
+    # Calculate total size needed
+    width = text_surface.get_width() + 2 * outline_width
+    height = text_surface.get_height() + 2 * outline_width
+    final_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+
+    # Blit outline
+    for dx in range(-outline_width, outline_width + 1):
+        for dy in range(-outline_width, outline_width + 1):
+            if dx != 0 or dy != 0:
+                final_surface.blit(outline_surface, (outline_width + dx, outline_width + dy))
+
+    # Blit main text
+    final_surface.blit(text_surface, (outline_width, outline_width))
+    return final_surface
+
+
+class TextCache:
+    """
+    LRU cache of rendered text surfaces
+    Keyed by (text, font, colors, outline width); holds at most max_entries surfaces
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def render(self, font, text, text_color, outline_color=None, outline_width=2):
+        """
+        Return the rendered (optionally outlined) text, rendering it only on a miss
+        The returned surface is shared, so callers must not draw onto it
+        """
+        key = (text, font, tuple(text_color), tuple(outline_color) if outline_color else None, outline_width)
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = render_outlined_text(font, text, text_color, outline_color, outline_width)
+        self._entries[key] = surface
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return surface
+
+    def resize(self, max_entries):
+        """Change the size limit, evicting the least recently used entries if needed"""
+        self.max_entries = max_entries
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class CachedLabel:
+    """A text label that re-renders only when the value it shows changes"""
+
+    def __init__(self, font, template, text_color, outline_color=None, outline_width=2, cache=None):
+        self.font = font
+        self.template = template
+        self.text_color = text_color
+        self.outline_color = outline_color
+        self.outline_width = outline_width
+        self.cache = cache
+        self._value = None
+        self._surface = None
+
+    def render(self, *values):
+        if self._surface is None or values != self._value:
+            text = self.template.format(*values)
+            if self.cache is not None:
+                self._surface = self.cache.render(self.font, text, self.text_color, self.outline_color, self.outline_width)
+            else:
+                self._surface = render_outlined_text(self.font, text, self.text_color, self.outline_color, self.outline_width)
+            self._value = values
+        return self._surface
+
+
+# shared cache, size can be tuned with DARK_SKIES_TEXT_CACHE_SIZE
+text_cache = TextCache(int(os.getenv("DARK_SKIES_TEXT_CACHE_SIZE", "256")))
@@ -0,0 +1,93 @@
+from bisect import bisect_right
+from collections import OrderedDict
+
+# Word widths per (font, word), shared by every layout; reset when it grows past the limit
+_word_widths = {}
+WORD_WIDTH_LIMIT = 8192
+
+
+def measure_word(font, word):
+    """Width of word in font, measured once"""
+    key = (font, word)
+    width = _word_widths.get(key)
+    if width is None:
+        if len(_word_widths) >= WORD_WIDTH_LIMIT:
+            _word_widths.clear()
+        width = _word_widths[key] = font.size(word)[0]
+    return width
+
+
+def break_lines(text, font, max_width):
+    """
+    Greedily break text into lines no wider than max_width (uncached)
+    Each word is measured once per font; line ends are found by binary search over the
+    cumulative word widths, then checked against the real width of the joined line
+    (kerning can make it differ slightly from the sum). A word wider than
+    max_width gets a line of its own.
+    """
+    words = text.split()
+    space = measure_word(font, " ")
+    # offsets[i] is the width of words[:i], each followed by a space
+    offsets = [0]
+    for word in words:
+        offsets.append(offsets[-1] + measure_word(font, word) + space)
+
+    lines = []
+    start = 0
+    while start < len(words):
+        # Furthest end with offsets[end] - offsets[start] - space <= max_width
+        end = max(start + 1, bisect_right(offsets, offsets[start] + max_width + space, start) - 1)
+        while end > start + 1 and font.size(" ".join(words[start:end]))[0] > max_width:
+            end -= 1
+        while end < len(words) and font.size(" ".join(words[start:end + 1]))[0] <= max_width:
+            end += 1
+        lines.append(" ".join(words[start:end]))
+        start = end
+    return lines
+
+
+class TextLayout:
+    """
+    LRU cache of wrapped text
+    Keyed by (text, font, max_width); holds at most max_entries layouts
+    """
+
+    def __init__(self, max_entries=128):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def wrap(self, text, font, max_width):
+        """
+        Return the lines of text wrapped to max_width, breaking them only on a miss
+        The returned tuple is shared between callers
+        """
+        key = (text, font, max_width)
+        lines = self._entries.get(key)
+        if lines is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return lines
+
+        self.misses += 1
+        lines = tuple(break_lines(text, font, max_width))
+        self._entries[key] = lines
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return lines
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# shared layout cache
+text_layout = TextLayout()
+
+
+def wrap_text(text, font, max_width):
+    """Wrap text to fit within max_width (memoized)"""
+    return text_layout.wrap(text, font, max_width)
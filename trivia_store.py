@@ -0,0 +1,132 @@
+import json
+import mmap
+import random
+from array import array
+
+DIFFICULTIES = ("easy", "medium", "hard")
+DEFAULT_DIFFICULTY = "easy"
+
+
+class TriviaStore:
+    """
+    Trivia questions indexed by difficulty and tag when loaded
+    A .json file (a list of questions) is parsed into memory. A .jsonl file (one
+    question per line) is memory-mapped instead: only line offsets are kept in the
+    index and each question is parsed when it is sampled, so large banks stay out of RAM.
+    """
+
+    def __init__(self):
+        self._questions = None
+        self._map = None
+        self._file = None
+        # difficulty -> positions, (difficulty, tag) -> positions
+        self._index = {}
+        self._count = 0
+
+    @classmethod
+    def load(cls, path):
+        store = cls()
+        if path.endswith(".jsonl"):
+            store._load_lines(path)
+        else:
+            with open(path, "r") as f:
+                store._load_list(json.load(f))
+        return store
+
+    @classmethod
+    def from_list(cls, questions):
+        store = cls()
+        store._load_list(questions)
+        return store
+
+    def _load_list(self, questions):
+        self._questions = questions
+        for position, question in enumerate(questions):
+            self._add_to_index(position, question)
+        self._count = len(questions)
+
+    def _load_lines(self, path):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        offset = 0
+        size = len(self._map)
+        while offset < size:
+            end = self._map.find(b"\n", offset)
+            if end == -1:
+                end = size
+            line = self._map[offset:end].strip()
+            if line:
+                self._add_to_index(offset, json.loads(line))
+                self._count += 1
+            offset = end + 1
+
+    def _add_to_index(self, position, question):
+        difficulty = question.get("difficulty", DEFAULT_DIFFICULTY)
+        self._index.setdefault(difficulty, array("q")).append(position)
+        for tag in question.get("tags", ()):
+            self._index.setdefault((difficulty, tag), array("q")).append(position)
+
+    def _question_at(self, position):
+        if self._questions is not None:
+            return self._questions[position]
+        end = self._map.find(b"\n", position)
+        if end == -1:
+            end = len(self._map)
+        return json.loads(self._map[position:end])
+
+    def count(self, difficulties=None, tag=None):
+        """Number of questions matching the difficulties (all if None) and optional tag"""
+        return sum(len(bucket) for bucket in self._buckets(difficulties, tag))
+
+    def _buckets(self, difficulties, tag):
+        if difficulties is None:
+            difficulties = [key for key in self._index if isinstance(key, str)]
+        if tag is None:
+            return [self._index[d] for d in difficulties if d in self._index]
+        return [self._index[(d, tag)] for d in difficulties if (d, tag) in self._index]
+
+    def select(self, difficulties=None, tag=None):
+        """
+        Return a view of the questions matching the difficulties and tag, without copying
+        Falls back to every question when nothing matches
+        """
+        selection = TriviaSelection(self, self._buckets(difficulties, tag))
+        if not selection and self._count:
+            return TriviaSelection(self, self._buckets(None, None))
+        return selection
+
+    def sample(self, difficulties=None, tag=None, rng=random):
+        """Pick a random question from the enabled difficulties"""
+        return self.select(difficulties, tag).sample(rng)
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = None
+            self._file = None
+
+    def __len__(self):
+        return self._count
+
+
+class TriviaSelection:
+    """A view over some index buckets of a TriviaStore; sampling never copies questions"""
+
+    def __init__(self, store, buckets):
+        self.store = store
+        self.buckets = buckets
+        self._size = sum(len(bucket) for bucket in buckets)
+
+    def sample(self, rng=random):
+        """Pick a question uniformly from all buckets in the view"""
+        if not self._size:
+            return None
+        pick = rng.randrange(self._size)
+        for bucket in self.buckets:
+            if pick < len(bucket):
+                return self.store._question_at(bucket[pick])
+            pick -= len(bucket)
+
+    def __len__(self):
+        return self._size